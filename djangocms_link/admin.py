@@ -1,14 +1,26 @@
 from __future__ import annotations
 
-from django.apps import apps
+import asyncio
+import copy
+import threading
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+import django
 from django.conf import settings
 from django.contrib import admin
-from django.core.exceptions import PermissionDenied
+from django.contrib.auth.views import redirect_to_login
+from django.core.exceptions import ImproperlyConfigured, PermissionDenied
+from django.db import close_old_connections
 from django.db.models import F, Model, Prefetch, Q, QuerySet
 from django.http import Http404, HttpRequest, JsonResponse
-from django.urls import path
+from django.urls import path, reverse
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from django.utils.translation import override
+from django.views.decorators.cache import never_cache
+from django.views.decorators.csrf import csrf_protect
 from django.views.generic.list import BaseListView
 
 from cms import __version__
@@ -16,9 +28,12 @@ from cms.models import Page
 from cms.utils import get_language_from_request, get_language_list
 from cms.utils.i18n import get_fallback_languages
 
-from . import models
+from asgiref.sync import sync_to_async
+
+from . import cache as link_cache
+from . import models, page_urls
 from .fields import LinkFormField, LinkWidget
-from .helpers import get_manager
+from .helpers import get_absolute_urls, get_manager, get_model_reference
 
 
 UNICODE_SPACE = "\u3000"  # This is a full-width space character (U+3000)
@@ -36,6 +51,54 @@ else:
 
 
 REGISTERED_ADMIN = []  # Will be set by djangocms_link.apps.DjangoCmsLinkConfig.ready
+CURSOR_TIMEOUT = 300  # Seconds the start of the next page of search results is remembered
+SEARCH_THREADS = getattr(settings, "DJANGOCMS_LINK_SEARCH_THREADS", 0)
+ASYNC_VIEW = getattr(settings, "DJANGOCMS_LINK_ASYNC_VIEW", False)
+
+_search_executor: ThreadPoolExecutor | None = None
+_search_executor_lock = threading.Lock()
+
+
+def get_search_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by all requests, limiting the number of concurrent searches."""
+    global _search_executor
+
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(max_workers=SEARCH_THREADS, thread_name_prefix="djangocms_link")
+    return _search_executor
+
+
+def fetch_in_thread(qs: QuerySet) -> list[Model]:
+    # The pool's threads keep their connections between searches. Like request threads, they
+    # close them if they are unusable or older than CONN_MAX_AGE.
+    close_old_connections()
+    try:
+        return list(qs)
+    finally:
+        close_old_connections()
+
+
+class PageWindow(Sequence):
+    """The objects of a single page of a longer result list for Django's paginator: Objects of
+    previous pages are not fetched, their positions are only counted."""
+
+    def __init__(self, offset: int, objects: list[Model]):
+        self.offset = offset
+        self.objects = objects
+
+    def __len__(self) -> int:
+        return self.offset + len(self.objects)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, _step = index.indices(len(self))
+            return self.objects[max(start - self.offset, 0):max(stop - self.offset, 0)]
+        if index < 0:
+            index += len(self)
+        if not self.offset <= index < len(self):
+            raise IndexError(index)
+        return self.objects[index - self.offset]
 
 
 class AdminUrlsView(BaseListView):
@@ -85,17 +148,44 @@ class AdminUrlsView(BaseListView):
         if not self.has_perm(request):
             raise PermissionDenied
 
+        cache_key = self.get_cache_key(request)
+        if cache_key:
+            data = link_cache.get_cache().get(cache_key)
+            if data is not None:
+                return JsonResponse(data)
+
+        self.object_list = self.get_paginated_multi_qs(self.get_querysets())
+        data = self.get_data()
+        if cache_key:
+            link_cache.get_cache().set(cache_key, data, timeout=link_cache.SEARCH_CACHE_DURATION)
+        return JsonResponse(data)
+
+    def get_querysets(self) -> list[QuerySet]:
+        """The page queryset followed by the querysets of all linkable models."""
         qs_list = [self.get_queryset()]
         self.add_admin_querysets(qs_list)
-        self.object_list = self.get_paginated_multi_qs(qs_list)
+        return qs_list
+
+    def get_data(self) -> dict:
+        """Serialize the paginated ``object_list``."""
         context = self.get_context_data()
         results = self.get_optgroups(context)
-        return JsonResponse(
-            {
-                "results": results,
-                "pagination": {"more": context["page_obj"].has_next()},
-            }
-        )
+        return {
+            "results": results,
+            "pagination": {"more": context["page_obj"].has_next()},
+        }
+
+    def get_search_parameters(self, request: HttpRequest) -> tuple:
+        """Parameters search results depend on. Results are not shared between users: Page
+        visibility depends on object-level page permissions, and model admins can check view
+        permissions per user."""
+        return self.term, self.language, self.site, request.user.pk
+
+    def get_cache_key(self, request: HttpRequest) -> str | None:
+        """Cache key of the search results (or None if they are not cached)."""
+        if not link_cache.SEARCH_CACHE_DURATION:
+            return None
+        return link_cache.get_search_key(*self.get_search_parameters(request), self.get_page())
 
     def get_page(self) -> int:
         page_kwarg = self.page_kwarg
@@ -108,46 +198,124 @@ class AdminUrlsView(BaseListView):
             )
         return page_number
 
-    def get_paginated_multi_qs(self, qs_list: list[QuerySet]) -> list[Model] | QuerySet:
+    def get_paginated_multi_qs(self, qs_list: list[QuerySet]) -> Sequence[Model] | QuerySet:
         """
         Paginate multiple querysets and return a result list.
         """
         if len(qs_list) == 1:
             # Only one qs, just use regular pagination
             return qs_list[0]
-        # Slice all querysets, evaluate and join them into a list.
+        page = self.get_page()
+        start, skip = self.get_start(page)
         # Collect one extra item so Django's paginator can detect has_next().
-        max_items = self.get_page() * self.paginate_by
-        objects = []
-        for qs in qs_list:
-            for item in qs:
-                if self.has_perm(self.request, item):
-                    objects.append(item)
-                    if len(objects) > max_items:
-                        break
-
-            if len(objects) > max_items:
+        objects, positions = self.collect_objects(qs_list, start, skip, self.paginate_by + 1)
+        return self.get_page_window(page, objects, positions)
+
+    def get_start(self, page: int) -> tuple[tuple[int, int], int]:
+        """Return the position to collect the objects of ``page`` from and the number of viewable
+        objects to skip there."""
+        cursor = self.get_cursor(page) if page > 1 else None
+        if cursor is not None:
+            # Continue where the previous page ended
+            return cursor, 0
+        return (0, 0), (page - 1) * self.paginate_by
+
+    def get_page_window(self, page: int, objects: list[Model], positions: list[tuple[int, int]]) -> PageWindow:
+        if len(objects) > self.paginate_by:
+            self.set_cursor(page + 1, positions[self.paginate_by])
+        return PageWindow((page - 1) * self.paginate_by, objects)
+
+    def collect_objects(
+        self,
+        qs_list: list[QuerySet],
+        start: tuple[int, int],
+        skip: int,
+        count: int,
+        prefetched: dict[int, list] | None = None,
+    ) -> tuple[list[Model], list[tuple[int, int]]]:
+        """
+        Return up to ``count`` objects the user may view, starting at the ``start`` position
+        (index of the queryset, offset in the queryset) after skipping ``skip`` viewable objects,
+        and the position of each object. Querysets are fetched in slices of the missing number of
+        objects. ``prefetched`` contains the first slices of querysets if already fetched.
+        """
+        objects, positions = [], []
+        if prefetched is None:
+            # First slices of all querysets, fetched concurrently if enabled. Objects to skip (no
+            # cursor) are fetched one queryset after another, since the first querysets might
+            # contain all of them.
+            prefetched = self.fetch_concurrently(qs_list, start, count) if SEARCH_THREADS > 1 and not skip else {}
+        for qs_index in range(start[0], len(qs_list)):
+            offset = start[1] if qs_index == start[0] else 0
+            while len(objects) < count:
+                limit = skip + count - len(objects)
+                if qs_index in prefetched:
+                    limit, chunk = skip + count, prefetched.pop(qs_index)
+                elif isinstance(qs_list[qs_index], QuerySet):
+                    chunk = list(qs_list[qs_index][offset:offset + limit])
+                else:
+                    chunk = list(islice(qs_list[qs_index], offset, offset + limit))
+                viewable = {id(item) for item in self.filter_viewable(self.request, chunk)}
+                for position, item in enumerate(chunk, start=offset):
+                    if id(item) in viewable:
+                        if skip:
+                            skip -= 1
+                        elif len(objects) < count:
+                            objects.append(item)
+                            positions.append((qs_index, position))
+                offset += len(chunk)
+                if len(chunk) < limit:
+                    break  # Queryset exhausted
+            if len(objects) >= count:
                 # No need to touch the rest of the querysets
                 # as we have enough items already
                 break
-        return objects
+        return objects, positions
+
+    def fetch_concurrently(self, qs_list: list[QuerySet], start: tuple[int, int], limit: int) -> dict[int, list]:
+        """Fetch the first ``limit`` objects of each queryset from the ``start`` position on in the
+        search thread pool. Each thread uses its own database connection."""
+        slices = self.get_slices(qs_list, start, limit)
+        if len(slices) < 2:
+            return {}
+        futures = {qs_index: get_search_executor().submit(fetch_in_thread, qs) for qs_index, qs in slices.items()}
+        return {qs_index: future.result() for qs_index, future in futures.items()}
+
+    def get_slices(self, qs_list: list[QuerySet], start: tuple[int, int], limit: int) -> dict[int, QuerySet]:
+        """The first ``limit`` objects of each queryset from the ``start`` position on."""
+        return {
+            qs_index: qs_list[qs_index][start[1] if qs_index == start[0] else 0:][:limit]
+            for qs_index in range(start[0], len(qs_list))
+            if isinstance(qs_list[qs_index], QuerySet)
+        }
+
+    def get_cursor_key(self, page: int) -> str:
+        # Cursors are raw queryset offsets: They are only valid for the objects the user may view
+        return link_cache.make_search_key("cursor", self.request.user.pk, self.term, self.language, self.site, page)
+
+    def get_cursor(self, page: int) -> tuple[int, int] | None:
+        """Position (index of the queryset, offset in the queryset) of the first object of ``page``
+        as recorded when the previous page was requested."""
+        return link_cache.get_cache().get(self.get_cursor_key(page))
+
+    def set_cursor(self, page: int, position: tuple[int, int]) -> None:
+        link_cache.get_cache().set(self.get_cursor_key(page), position, timeout=CURSOR_TIMEOUT)
 
     def get_reference(self, request: HttpRequest) -> JsonResponse:
         try:
             model_str, pk = request.GET.get("g").split(":")
-            app, model = model_str.split(".")
-            model = apps.get_model(app, model)
+            model, manager = get_model_reference(model_str)
             model_admin = self.admin_site._registry.get(model)
             language = get_language_from_request(request)
             self.language = language
 
             if model_str == "cms.page" and _version >= 4 or model_admin is None:
-                obj = get_manager(model).get(pk=pk)
+                obj = manager.get(pk=pk)
                 if model_str == "cms.page":
                     obj.__link_text__ = obj.get_admin_content(language, fallback=True).title
                 return JsonResponse(self.serialize_result(obj) or {})
             elif model_str == "cms.page":
-                obj = get_manager(model).get(pk=pk)
+                obj = manager.get(pk=pk)
                 obj.__link_text__ = obj.get_title(language, fallback=True)
                 return JsonResponse(self.serialize_result(obj) or {})
 
@@ -163,6 +331,14 @@ class AdminUrlsView(BaseListView):
         results = []
         model = {}
         previous_model = None
+        # Urls of models implementing get_absolute_urls with one call per model
+        self.absolute_urls = get_absolute_urls(obj for obj in context["object_list"] if not isinstance(obj, Page))
+        self.page_urls = {}
+        if page_urls.PAGE_URLS:
+            # Page urls from the materialized page url table with one query
+            self.page_urls = page_urls.get_language_urls(
+                obj.pk for obj in context["object_list"] if isinstance(obj, Page)
+            )
         for obj in context["object_list"]:
             if obj._meta.verbose_name_plural != previous_model or not model:
                 if model:  # Don't add the initial empty model
@@ -215,6 +391,8 @@ class AdminUrlsView(BaseListView):
 
     def get_absolute_url(self, obj: Model, language: str | None = None) -> str:
         if isinstance(obj, Page):
+            if (obj.pk, language or get_language()) in getattr(self, "page_urls", {}):
+                return self.page_urls[obj.pk, language or get_language()]
             try:
                 return obj.get_absolute_url(language=language)
             except TypeError:
@@ -223,6 +401,9 @@ class AdminUrlsView(BaseListView):
                 except TypeError:
                     with override(language):
                         return obj.get_absolute_url()
+        key = (obj._meta.label_lower, obj.pk)
+        if key in getattr(self, "absolute_urls", {}):
+            return self.absolute_urls[key]
         return obj.get_absolute_url()
 
     def get_queryset(self) -> QuerySet:
@@ -299,8 +480,10 @@ class AdminUrlsView(BaseListView):
     def add_admin_querysets(self, qs: list[QuerySet]) -> None:
         for model_admin in REGISTERED_ADMIN:
             try:
-                # hack: GrouperModelAdmin expects a language to be temporarily set
+                # hack: GrouperModelAdmin expects a language to be temporarily set. Set it on a copy
+                # since model admins are shared by all requests.
                 if isinstance(model_admin, GrouperModelAdmin):  # pragma: no cover
+                    model_admin = copy.copy(model_admin)
                     model_admin.language = self.language
                 if hasattr(model_admin, "get_link_queryset"):
                     # Allow model admins to define get_link_queryset to do additional
@@ -343,10 +526,96 @@ class AdminUrlsView(BaseListView):
         """Check if user has permission to access the related model."""
         if obj is None:
             return True
-        model_admin = self.admin_site._registry.get(obj.__class__)
-        if model_admin is None:
-            return False
-        return model_admin.has_view_permission(request, obj=obj)
+        return bool(self.filter_viewable(request, [obj]))
+
+    def filter_viewable(self, request: HttpRequest, objs: list[Model]) -> list[Model]:
+        """
+        Return the objects the user may view, keeping their order. Model admins can check many
+        objects at once by implementing ``filter_viewable(request, objs)``. Model admins which do
+        not override ``has_view_permission`` only need a single check per model, others are asked
+        for each object.
+        """
+        by_model = {}
+        for obj in objs:
+            by_model.setdefault(obj.__class__, []).append(obj)
+        viewable = set()
+        for model, model_objs in by_model.items():
+            model_admin = self.admin_site._registry.get(model)
+            if model_admin is None:
+                continue
+            if hasattr(model_admin, "filter_viewable"):
+                model_objs = model_admin.filter_viewable(request, model_objs)
+            elif type(model_admin).has_view_permission is admin.ModelAdmin.has_view_permission:
+                # The object does not matter
+                if not model_admin.has_view_permission(request):
+                    continue
+            else:
+                model_objs = [obj for obj in model_objs if model_admin.has_view_permission(request, obj=obj)]
+            viewable.update(id(obj) for obj in model_objs)
+        return [obj for obj in objs if id(obj) in viewable]
+
+
+class AsyncAdminUrlsView(AdminUrlsView):
+    """Asynchronous variant of ``AdminUrlsView`` for ASGI servers returning the same data.
+    Django's ORM is synchronous: Model admin hooks, permission checks and serialization run in
+    ``sync_to_async`` (in the request's thread), grouped into as few steps as possible. The first
+    slices of the page and linkable model querysets are fetched concurrently, each in a thread
+    of its own with its own database connection."""
+
+    async def get(self, request: HttpRequest, *args, **kwargs) -> JsonResponse:
+        if request.GET.get("g"):
+            # Get name of a reference
+            return await sync_to_async(self.get_reference)(request)
+
+        cache_key = await sync_to_async(self.start_search)(request)
+        if cache_key:
+            data = await link_cache.get_cache().aget(cache_key)
+            if data is not None:
+                return JsonResponse(data)
+
+        qs_list, start, skip = await sync_to_async(self.get_search_start)()
+        prefetched = {}
+        if len(qs_list) > 1 and not skip:
+            # Objects to skip (no cursor) are collected one queryset after another
+            prefetched = await self.fetch_slices(qs_list, start, self.paginate_by + 1)
+        data = await sync_to_async(self.get_search_data)(qs_list, start, skip, prefetched)
+        if cache_key:
+            await link_cache.get_cache().aset(cache_key, data, timeout=link_cache.SEARCH_CACHE_DURATION)
+        return JsonResponse(data)
+
+    def start_search(self, request: HttpRequest) -> str | None:
+        """Process the request, check the permission and return the cache key of the results."""
+        self.term, self.language, self.site = self.process_request(request)
+        if not self.has_perm(request):
+            raise PermissionDenied
+        return self.get_cache_key(request)
+
+    def get_search_start(self) -> tuple[list[QuerySet], tuple[int, int], int]:
+        """Return the querysets to search, and the position and number of objects to skip."""
+        qs_list = self.get_querysets()
+        start, skip = self.get_start(self.get_page()) if len(qs_list) > 1 else ((0, 0), 0)
+        return qs_list, start, skip
+
+    async def fetch_slices(self, qs_list: list[QuerySet], start: tuple[int, int], limit: int) -> dict[int, list]:
+        """Fetch the first ``limit`` objects of each queryset from the ``start`` position on
+        concurrently. Thread-sensitive ``sync_to_async`` calls would run one after another."""
+        slices = self.get_slices(qs_list, start, limit)
+        fetch = sync_to_async(fetch_in_thread, thread_sensitive=False)
+        chunks = await asyncio.gather(*(fetch(qs) for qs in slices.values()))
+        return dict(zip(slices, chunks))
+
+    def get_search_data(
+        self, qs_list: list[QuerySet], start: tuple[int, int], skip: int, prefetched: dict[int, list]
+    ) -> dict:
+        """Collect the objects of the requested page (using the ``prefetched`` slices) and
+        serialize them."""
+        if len(qs_list) == 1:
+            self.object_list = qs_list[0]
+        else:
+            page = self.get_page()
+            objects, positions = self.collect_objects(qs_list, start, skip, self.paginate_by + 1, prefetched)
+            self.object_list = self.get_page_window(page, objects, positions)
+        return self.get_data()
 
 
 class LinkAdmin(admin.ModelAdmin):
@@ -367,16 +636,38 @@ class LinkAdmin(admin.ModelAdmin):
 
     def get_urls(self) -> list:
         # Only url endpoint public, do not call super().get_urls()
+        if ASYNC_VIEW:
+            if django.VERSION < (5, 0):
+                raise ImproperlyConfigured("DJANGOCMS_LINK_ASYNC_VIEW requires Django 5.0 or later.")
+            view = self.async_admin_view(self.async_url_view)
+        else:
+            view = self.admin_site.admin_view(self.url_view)
         return [
             path(
                 "urls",
-                self.admin_site.admin_view(self.url_view),
+                view,
                 name=self.global_link_url_name,
             ),
         ]
 
+    def async_admin_view(self, view):
+        """Async counterpart of ``AdminSite.admin_view`` (requires Django 5.0+ for async support
+        of ``never_cache`` and ``csrf_protect``)."""
+
+        async def inner(request: HttpRequest, *args, **kwargs):
+            if not await sync_to_async(self.admin_site.has_permission)(request):
+                return redirect_to_login(
+                    request.get_full_path(), reverse("admin:login", current_app=self.admin_site.name)
+                )
+            return await view(request, *args, **kwargs)
+
+        return csrf_protect(never_cache(inner))
+
     def url_view(self, request: HttpRequest) -> JsonResponse:
         return AdminUrlsView.as_view(admin_site=self.admin_site)(request)
 
+    async def async_url_view(self, request: HttpRequest) -> JsonResponse:
+        return await AsyncAdminUrlsView.as_view(admin_site=self.admin_site)(request)
+
 
 admin.site.register(models.Link, LinkAdmin)
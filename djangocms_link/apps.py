@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from django.apps import AppConfig, apps
 from django.conf import settings
 from django.contrib.admin import ModelAdmin
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Model
 from django.utils.translation import gettext_lazy as _
 
 
@@ -48,3 +51,78 @@ class DjangoCmsLinkConfig(AppConfig):
                         'DJANGOCMS_LINK_LINKABLE_MODELS must be a list of string "app_label.model_name"'
                     )
             link_admin.REGISTERED_ADMIN = admins
+
+        target_models = self.get_target_models(link_admin.REGISTERED_ADMIN)
+        self.register_cached_models(target_models)
+        self.connect_stored_urls(target_models)
+        self.connect_page_urls()
+        self.connect_snapshot(target_models)
+        self.connect_link_index()
+        self.build_model_references(link_admin.REGISTERED_ADMIN)
+
+    def build_model_references(self, model_admins: list[ModelAdmin]) -> None:
+        """Register all link target models with the model reference registry"""
+        from cms.models import Page
+
+        from djangocms_link.helpers import build_model_references
+
+        link_models = [Page] + [model_admin.model for model_admin in model_admins]
+        if apps.is_installed("filer"):
+            from filer.models import File
+
+            link_models.append(File)
+        build_model_references(link_models)
+
+    def get_target_models(self, model_admins: list[ModelAdmin]) -> list[tuple[type[Model], str | None]]:
+        """Return the models whose changes affect link urls, each with the label of the link
+        targets it affects (None for the model itself)"""
+        target_models = []
+        for model_name in ("Page", "PageContent", "Title", "PageUrl", "TreeNode"):
+            model = getattr(apps.get_app_config("cms").models_module, model_name, None)
+            if model is not None:
+                target_models.append((model, "cms.page"))
+        if apps.is_installed("filer"):
+            from filer.models import File
+
+            target_models += [(model, "filer.file") for model in apps.get_models() if issubclass(model, File)]
+        target_models += [(model_admin.model, None) for model_admin in model_admins]
+        return target_models
+
+    def register_cached_models(self, target_models: list[tuple[type[Model], str | None]]) -> None:
+        """Register all link targets with the shared url cache and connect its invalidation signals"""
+        from django.contrib.sites.models import Site
+        from django.db.models.signals import post_delete, post_save
+
+        from djangocms_link import cache
+        from djangocms_link.helpers import clear_site_domains
+
+        post_save.connect(clear_site_domains, sender=Site, dispatch_uid="djangocms_link_site_domains_save")
+        post_delete.connect(clear_site_domains, sender=Site, dispatch_uid="djangocms_link_site_domains_delete")
+        cache.register_model(Site, cache.GLOBAL)
+        for model, label in target_models:
+            cache.register_model(model, label)
+        cache.connect_signals()
+
+    def connect_stored_urls(self, target_models: list[tuple[type[Model], str | None]]) -> None:
+        """Refresh stored link urls when link targets change"""
+        from djangocms_link import stored_urls
+
+        stored_urls.connect_signals(dict(target_models))
+
+    def connect_page_urls(self) -> None:
+        """Maintain the materialized page url table"""
+        from djangocms_link import page_urls
+
+        page_urls.connect_signals()
+
+    def connect_snapshot(self, target_models: list[tuple[type[Model], str | None]]) -> None:
+        """Mark the link snapshot as stale when link targets change"""
+        from djangocms_link import snapshot
+
+        snapshot.connect_signals(dict(target_models))
+
+    def connect_link_index(self) -> None:
+        """Maintain the reverse link index"""
+        from djangocms_link import references
+
+        references.connect_signals()
@@ -0,0 +1,217 @@
+"""
+Shared cache for the resolved urls of internal and file links.
+
+Resolved urls are stored in Django's cache framework, keyed by the link target reference
+(including its anchor), the site and the language. Each key also contains a version per
+target model which is replaced whenever an object of that model (or a related model
+defining its url, such as a page's content or url records) is saved or deleted, or a page is
+published, unpublished or moved. This invalidates all cached urls of that model at once, so
+that descendants of a moved page are covered, too.
+
+The cache is disabled unless ``DJANGOCMS_LINK_CACHE_DURATION`` is set to a positive number
+of seconds.
+
+Search results of the link autocomplete endpoint are cached for
+``DJANGOCMS_LINK_SEARCH_CACHE_DURATION`` seconds (disabled by default). They share a single
+version which is replaced whenever any link target is changed.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models
+from django.utils.translation import get_language
+
+from djangocms_link.signals import connect_model_signals, connect_page_operation_signals
+
+
+CACHE_DURATION = getattr(settings, "DJANGOCMS_LINK_CACHE_DURATION", 0)
+CACHE_ALIAS = getattr(settings, "DJANGOCMS_LINK_CACHE", "default")
+CACHE_PREFIX = "djangocms_link"
+SEARCH_CACHE_DURATION = getattr(settings, "DJANGOCMS_LINK_SEARCH_CACHE_DURATION", 0)
+LOCK_TIMEOUT = 5  # seconds a lock for a missing url is held at most
+LOCK_WAIT = 1  # seconds to wait for another process to compute a url
+LOCK_POLL = 0.05
+
+GLOBAL = "*"  # Version label for changes affecting all links, e.g., site domains
+SEARCH = "search"  # Version label of autocomplete search results
+
+_invalidates: dict[type[models.Model], set[str]] = defaultdict(set)
+_cacheable: set[str] = set()
+
+
+def get_cache():
+    return caches[CACHE_ALIAS]
+
+
+def is_enabled() -> bool:
+    return bool(CACHE_DURATION)
+
+
+def register_model(model: type[models.Model], label: str | None = None) -> None:
+    """
+    Cache urls of links pointing to ``label`` (defaults to the model's label) and invalidate
+    them if an instance of ``model`` is saved or deleted.
+    """
+    label = label or model._meta.label_lower
+    _invalidates[model].add(label)
+    if label != GLOBAL:
+        _cacheable.add(label)
+
+
+def invalidate(*labels: str) -> None:
+    """Invalidate all cached urls of links pointing to models with the given labels."""
+    if not is_enabled() or not labels:
+        return
+    get_cache().set_many(
+        {_version_key(label): uuid.uuid4().hex for label in labels}, timeout=None
+    )
+
+
+def invalidate_search() -> None:
+    """Invalidate all cached search results of the autocomplete endpoint."""
+    if SEARCH_CACHE_DURATION:
+        get_cache().set(_version_key(SEARCH), uuid.uuid4().hex, timeout=None)
+
+
+def invalidate_model(sender: type[models.Model], **kwargs) -> None:
+    labels = _invalidates.get(sender)
+    if labels:
+        invalidate(*labels)
+        invalidate_search()
+
+
+def invalidate_pages(*args, **kwargs) -> None:
+    invalidate("cms.page")
+    invalidate_search()
+
+
+def make_search_key(kind: str, *parts: object) -> str:
+    """Return the cache key of ``kind`` (e.g., "search") data derived from autocomplete search
+    results for the given request parameters. Keys change when search results are invalidated."""
+    digest = hashlib.md5(
+        "|".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:{kind}:{_get_versions([SEARCH])[SEARCH]}:{digest}"
+
+
+def get_search_key(*parts: object) -> str | None:
+    """Return the cache key of autocomplete search results for the given request parameters,
+    or None if search results are not cached."""
+    if not SEARCH_CACHE_DURATION:
+        return None
+    return make_search_key("search", *parts)
+
+
+def connect_signals() -> None:
+    """Invalidate cached urls and search results if a registered model is changed. Nothing is
+    connected if both caches are disabled: ``post_delete`` receivers prevent fast deletes."""
+    if not is_enabled() and not SEARCH_CACHE_DURATION:
+        return
+    connect_model_signals(invalidate_model, list(_invalidates), "djangocms_link_cache")
+    connect_page_operation_signals(invalidate_pages, "djangocms_link_cache")
+
+
+def _version_key(label: str) -> str:
+    return f"{CACHE_PREFIX}:version:{label}"
+
+
+def _get_versions(labels: Iterable[str]) -> dict[str, str]:
+    cache = get_cache()
+    keys = {_version_key(label): label for label in labels}
+    versions = cache.get_many(keys)
+    for key in keys.keys() - versions.keys():
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        versions[key] = cache.get(key)
+    return {label: versions[key] for key, label in keys.items()}
+
+
+def _get_label(link_field_value: dict) -> str | None:
+    if "internal_link" in link_field_value:
+        return link_field_value["internal_link"].split(":", 1)[0].lower()
+    if "file_link" in link_field_value:
+        return "filer.file"
+    return None
+
+
+def _url_key(link_field_value: dict, label: str, versions: dict[str, str], site_id: int, language: str) -> str:
+    reference = link_field_value.get("internal_link") or f"filer.file:{link_field_value.get('file_link')}"
+    digest = hashlib.md5(
+        f"{reference}{link_field_value.get('anchor', '')}:{site_id}:{language}".encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:url:{versions[GLOBAL]}:{versions[label]}:{digest}"
+
+
+def resolve_cached(
+    link_field_values: list[dict],
+    site_id: int | None,
+    resolve: Callable[[list[dict]], None],
+) -> None:
+    """
+    Fill the cache of the given link field values from the shared cache. Only values missing
+    in the shared cache are passed to ``resolve`` which is expected to cache their url. If
+    several processes miss the same url at the same time, only one of them resolves it while
+    the others wait for the result.
+    """
+    if not is_enabled():
+        resolve(link_field_values)
+        return
+
+    from djangocms_link.helpers import get_cached_url, get_current_site_id, set_cached_url
+
+    requested_site_id = site_id  # Key of the link field values' cache slots
+    if site_id is None:
+        site_id = get_current_site_id()
+    language = get_language()
+    cache = get_cache()
+
+    uncached, by_label = [], defaultdict(list)
+    for link_field_value in link_field_values:
+        label = _get_label(link_field_value)
+        if label in _cacheable:
+            by_label[label].append(link_field_value)
+        else:
+            uncached.append(link_field_value)
+    if not by_label:
+        resolve(uncached)
+        return
+
+    versions = _get_versions([GLOBAL, *by_label])
+    by_key = defaultdict(list)
+    for label, values in by_label.items():
+        for link_field_value in values:
+            by_key[_url_key(link_field_value, label, versions, site_id, language)].append(link_field_value)
+
+    def from_cache(keys):
+        found = cache.get_many(keys)
+        for key, (url,) in found.items():
+            for link_field_value in by_key[key]:
+                set_cached_url(link_field_value, url, requested_site_id)
+        return [key for key in keys if key not in found]
+
+    missing = from_cache(list(by_key))
+    locked = [key for key in missing if cache.add(f"{key}:lock", 1, timeout=LOCK_TIMEOUT)]
+    waiting = [key for key in missing if key not in locked]
+
+    resolve(uncached + [link_field_value for key in locked for link_field_value in by_key[key]])
+    if locked:
+        cache.set_many(
+            {key: (get_cached_url(by_key[key][0], requested_site_id)[1],) for key in locked},
+            timeout=CACHE_DURATION,
+        )
+        cache.delete_many([f"{key}:lock" for key in locked])
+
+    deadline = time.monotonic() + LOCK_WAIT
+    while waiting and time.monotonic() < deadline:
+        time.sleep(LOCK_POLL)
+        waiting = from_cache(waiting)
+    if waiting:
+        # Other process did not finish in time: resolve without caching
+        resolve([link_field_value for key in waiting for link_field_value in by_key[key]])
@@ -2,17 +2,20 @@ from __future__ import annotations
 
 import copy
 
-from django.contrib.sites.shortcuts import get_current_site
+from django.conf import settings
 from django.db import models
+from django.http import HttpRequest
 from django.utils.translation import gettext_lazy as _
 
+from cms.models import CMSPlugin
 from cms.plugin_base import CMSPluginBase
 from cms.plugin_pool import plugin_pool
 
+from djangocms_link import deferred, menu_urls
 from djangocms_link.fields import LinkFormField
 
-from .helpers import get_link
-from .models import Link
+from .helpers import get_current_site_id, get_link, resolve_links
+from .models import AbstractLink, Link
 
 
 def patch(original: callable) -> callable:
@@ -38,6 +41,44 @@ def patch(original: callable) -> callable:
 CMSPluginBase.get_form = patch(CMSPluginBase.get_form)
 
 
+def get_plugin_tree(instance: CMSPlugin) -> tuple[object, list[CMSPlugin]]:
+    """
+    Return all plugin instances rendered together with ``instance`` and the object they
+    belong to: If available, all plugins of the placeholder already loaded by the content
+    renderer, otherwise the plugin tree ``instance`` is part of. No database queries are made.
+    """
+    placeholder = instance.placeholder if CMSPlugin.placeholder.is_cached(instance) else None
+    plugins = getattr(placeholder, "_all_plugins_cache", None)
+    if plugins is not None:
+        return placeholder, plugins
+
+    root = instance
+    while CMSPlugin.parent.is_cached(root) and root.parent is not None:
+        root = root.parent
+    plugins, stack = [], [root]
+    while stack:
+        plugin = stack.pop()
+        plugins.append(plugin)
+        stack.extend(getattr(plugin, "child_plugin_instances", None) or [])
+    return root, plugins
+
+
+def prefetch_links(instance: CMSPlugin, site_id: int | None = None, request: HttpRequest | None = None) -> None:
+    """
+    Resolve the links of all link plugins rendered together with ``instance`` at once,
+    requiring one query per link target model. Each placeholder (or plugin tree) is only
+    processed once. If a request is given, page links are taken from the menu if enabled.
+    """
+    owner, plugins = get_plugin_tree(instance)
+    if getattr(owner, "_links_prefetched", False):
+        return
+    links = [plugin.link for plugin in plugins if isinstance(plugin, AbstractLink)]
+    if request is not None and menu_urls.MENU_URLS:
+        menu_urls.resolve_from_menu(request, links, site_id)
+    resolve_links(links, site_id)
+    owner._links_prefetched = True
+
+
 class LinkPlugin(CMSPluginBase):
     model = Link
     name = _("Link")
@@ -50,6 +91,8 @@ class LinkPlugin(CMSPluginBase):
         '1 1 2.83 2.83l-.793.792c.112.42.155.855.128 1.287l1.372-1.372a3 3 0 1 0-4.243-4.243z"/></svg>'
     )
     allow_children = True
+    # Resolve all links of a placeholder before rendering its first link plugin
+    prefetch_links = getattr(settings, "DJANGOCMS_LINK_PREFETCH_LINKS", False)
 
     fieldsets = [
         (
@@ -78,9 +121,14 @@ class LinkPlugin(CMSPluginBase):
         return f"djangocms_link/{instance.template}/link.html"
 
     def render(self, context, instance, placeholder):
-        context["link"] = get_link(
-            instance.link, getattr(get_current_site(context["request"]), "id", None)
-        )
+        request = context["request"]
+        site_id = get_current_site_id(request)
+        if self.prefetch_links and not deferred.is_deferring():
+            prefetch_links(instance, site_id, request)
+        elif menu_urls.MENU_URLS:
+            menu_urls.resolve_from_menu(request, [instance.link], site_id)
+        # Deferred links are resolved together by DeferredLinksMiddleware
+        context["link"] = deferred.defer(instance.link, site_id) or get_link(instance.link, site_id)
         return super().render(context, instance, placeholder)
 
 
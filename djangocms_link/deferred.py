@@ -0,0 +1,120 @@
+"""
+Deferred link urls: Instead of resolving each link while a response is rendered, link plugins
+and the ``deferred_link`` template tag output a token describing the link (its target
+reference, anchor, site and language). ``DeferredLinksMiddleware`` collects all tokens of the
+response, resolves them with one query per link target model and site (see
+``resolve_links``) and replaces the tokens by the links' urls.
+
+Tokens are signed with the ``SECRET_KEY``: Only tokens created by ``defer`` are replaced, not
+tokens in user-supplied text echoed by a page. Tokens do not depend on the request. Rendered
+content cached with tokens (e.g., by django CMS's placeholder cache) is resolved when it is
+served.
+
+Links are only deferred if ``DJANGOCMS_LINK_DEFERRED_LINKS`` is set to ``True`` and the
+middleware is installed.
+"""
+from __future__ import annotations
+
+import base64
+import re
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.signing import BadSignature, Signer
+from django.utils.html import escape
+from django.utils.translation import get_language, override
+
+
+DEFERRED_LINKS = getattr(settings, "DJANGOCMS_LINK_DEFERRED_LINKS", False)
+TOKEN_PATTERN = re.compile(rb"djangocms-link:([A-Za-z0-9_-]+:[A-Za-z0-9_-]+);")  # Signed payload
+SALT = "djangocms_link.deferred"
+
+_deferring: ContextVar[bool] = ContextVar("djangocms_link_deferring", default=False)
+
+
+@contextmanager
+def deferred_links() -> Iterator[None]:
+    """Let ``defer`` return tokens within the context."""
+    token = _deferring.set(True)
+    try:
+        yield
+    finally:
+        _deferring.reset(token)
+
+
+def is_deferring() -> bool:
+    return _deferring.get()
+
+
+def encode(link_field_value: dict, site_id: int | None, language: str | None) -> str:
+    reference = link_field_value.get("internal_link") or f"file:{link_field_value['file_link']}"
+    data = "\n".join((reference, link_field_value.get("anchor", ""), str(site_id or ""), language or ""))
+    payload = Signer(salt=SALT).sign(base64.urlsafe_b64encode(data.encode()).decode().rstrip("="))
+    return f"djangocms-link:{payload};"
+
+
+def decode(payload: bytes) -> tuple[dict, int | None, str | None] | None:
+    """Return the link field value, site id and language of a token's payload, or None if the
+    payload is invalid or its signature does not match."""
+    try:
+        data = Signer(salt=SALT).unsign(payload.decode()).encode()
+        data = base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4)).decode()
+        reference, anchor, site_id, language = data.split("\n")
+    except (BadSignature, ValueError):  # Forged token, invalid base64, unicode or number of fields
+        return None
+    if reference.startswith("file:"):
+        link_field_value = {"file_link": reference[5:]}
+    else:
+        link_field_value = {"internal_link": reference}
+    if anchor:
+        link_field_value["anchor"] = anchor
+    return link_field_value, int(site_id) if site_id.isdigit() else None, language or None
+
+
+def defer(link_field_value: dict, site_id: int | None = None) -> str | None:
+    """Return a token for a link whose url needs to be resolved, or None if links are not
+    deferred or the url is known without database access."""
+    if not is_deferring() or not link_field_value or "external_link" in link_field_value:
+        return None
+
+    from djangocms_link.helpers import get_cached_url, get_rel_reference
+
+    language = get_language()
+    if (
+        get_cached_url(link_field_value, site_id)[0]
+        or getattr(link_field_value, "stored_urls", {}).get(language) is not None
+        or get_rel_reference(link_field_value) is None
+    ):
+        return None
+    return encode(link_field_value, site_id, language)
+
+
+def substitute(content: bytes, site_id: int | None = None, charset: str = "utf-8", html: bool = True) -> bytes:
+    """Replace all tokens in ``content`` by their links' urls (escaped for ``html``). Tokens
+    without site use ``site_id``. Links are resolved with one query per model, site and language."""
+    payloads = set(TOKEN_PATTERN.findall(content))
+    if not payloads:
+        return content
+
+    from djangocms_link.helpers import get_link, resolve_links
+
+    links, groups = {}, defaultdict(list)
+    for payload in payloads:
+        decoded = decode(payload)
+        if decoded is not None:
+            link_field_value, link_site_id, language = decoded
+            links[payload] = link_field_value, link_site_id or site_id, language
+            groups[link_site_id or site_id, language].append(link_field_value)
+    urls = {}
+    for (link_site_id, language), link_field_values in groups.items():
+        with override(language):
+            resolve_links(link_field_values, link_site_id)
+    for payload, (link_field_value, link_site_id, language) in links.items():
+        with override(language):
+            url = get_link(link_field_value, link_site_id) or ""
+        urls[payload] = (escape(url) if html else url).encode(charset)
+
+    return TOKEN_PATTERN.sub(lambda match: urls.get(match[1], match[0]), content)
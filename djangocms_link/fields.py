@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import json
+from importlib import import_module
 
 from django.apps import apps
 from django.conf import settings
@@ -10,6 +11,8 @@ from django.contrib.admin.widgets import SELECT2_TRANSLATIONS, AutocompleteSelec
 from django.contrib.sites.models import Site
 from django.db import models
 from django.db.models import JSONField, ManyToOneRel
+from django.db.models.query_utils import DeferredAttribute
+from django.db.models.signals import class_prepared
 from django.forms import Field, MultiWidget, Select, TextInput, URLInput
 from django.utils.encoding import force_str
 from django.utils.translation import get_language
@@ -18,7 +21,9 @@ from django.utils.translation import override
 
 from cms.utils.urlutils import admin_reverse
 
-from djangocms_link.helpers import LinkDict, get_manager
+from djangocms_link import references, stored_urls
+from djangocms_link.helpers import LinkDict, get_model_reference
+from djangocms_link.lookups import LinkType, PointsTo, TargetModel
 
 
 try:
@@ -33,6 +38,20 @@ from djangocms_link.validators import AnchorValidator, ExtendedURLValidator
 MINIMUM_INPUT_LENGTH = getattr(settings, "DJANGOCMS_LINK_MINIMUM_INPUT_LENGTH", 0)
 
 
+def get_json_codec(module_path: str | None):
+    """Return the module providing ``loads`` and ``dumps`` for LinkFields (e.g., "orjson"), or None if
+    not set or not installed. Without codec, Django's JSONField encoding and decoding is used."""
+    if not module_path:
+        return None
+    try:
+        return import_module(module_path)
+    except ModuleNotFoundError:
+        return None
+
+
+JSON_CODEC = get_json_codec(getattr(settings, "DJANGOCMS_LINK_JSON_CODEC", None))
+
+
 class LinkAutoCompleteWidget(AutocompleteSelect):
     def __init__(self, attrs: dict | None = None, language: str | None = None):
         super().__init__(None, None, attrs)
@@ -43,8 +62,7 @@ class LinkAutoCompleteWidget(AutocompleteSelect):
         for value in values:
             if value:
                 model_path, pk = value.split(":", 1)
-                model = apps.get_model(*model_path.split(".", 1))
-                internal_obj.append(get_manager(model).filter(pk=pk).first())
+                internal_obj.append(get_model_reference(model_path)[1].filter(pk=pk).first())
             else:
                 internal_obj.append(None)
         return internal_obj
@@ -382,18 +400,113 @@ class LinkField(JSONField):
         kwargs.setdefault("form_class", LinkFormField)
         return super().formfield(**kwargs)
 
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        if not cls._meta.abstract and cls._meta.apps is apps:  # Skip historical models of migrations
+            references.register(cls, self.attname)
+
     def get_prep_value(self, value):
         if isinstance(value, dict):
             # Drop any cached value without changing the original value
-            return super().get_prep_value(dict(**{
-                key: val for key, val in value.items() if key != "__cache__"
-            }))
+            value = {key: val for key, val in value.items() if key != "__cache__"}
+            if isinstance(value.get("external_link"), str) and value["external_link"].startswith("tel:"):
+                # Store phone numbers in their canonical form
+                value["external_link"] = value["external_link"].replace(" ", "")
+            return super().get_prep_value(value)
         return super().get_prep_value(value)
 
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if JSON_CODEC is None or self.encoder is not None:
+            return super().get_db_prep_value(value, connection, prepared)
+        if not prepared:
+            value = self.get_prep_value(value)
+        if connection.vendor == "postgresql":
+            from django.db.backends.postgresql.psycopg_any import Jsonb
+
+            return Jsonb(value, dumps=self.dumps)
+        return self.dumps(value)
+
+    @staticmethod
+    def dumps(value) -> str:
+        value = JSON_CODEC.dumps(value)
+        return value.decode() if isinstance(value, bytes) else value  # orjson returns bytes
+
     def from_db_value(self, value, expression, connection):
+        if isinstance(value, str) and self.decoder is None:
+            # Fast path for the common case: decode and wrap in one step
+            try:
+                value = (JSON_CODEC or json).loads(value)
+            except ValueError:  # Also the base class of orjson's JSONDecodeError
+                return LinkDict(value)
+            return LinkDict.from_dict(value) if isinstance(value, dict) else LinkDict(value)
         value = super().from_db_value(value, expression, connection)
         return LinkDict(value)
 
     def to_python(self, value):
         value = super().to_python(value)
         return LinkDict(value)
+
+
+LinkField.register_lookup(PointsTo)
+LinkField.register_lookup(TargetModel)
+LinkField.register_lookup(LinkType)
+
+
+class StoredURLsAttribute(DeferredAttribute):
+    """Descriptor of a LinkField with a LinkURLsField: Makes the stored urls available to
+    get_link without an additional query when the link is read (not when the model is
+    instantiated)."""
+
+    def __init__(self, field: LinkField, urls_attname: str):
+        super().__init__(field)
+        self.urls_attname = urls_attname
+
+    def __get__(self, instance, cls=None):
+        link = super().__get__(instance, cls)
+        if stored_urls.STORE_URLS and isinstance(link, LinkDict) and not hasattr(link, "stored_urls"):
+            urls = instance.__dict__.get(self.urls_attname)
+            if urls:
+                link.stored_urls = urls
+        return link
+
+    def __set__(self, instance, value):
+        # A data descriptor: __get__ is also called if the value is in the instance dict
+        if self.field.attname in instance.__dict__ and instance.__dict__[self.field.attname] is not value:
+            # A new link: The stored urls belong to the previous one (they are refreshed on save)
+            instance.__dict__[self.urls_attname] = {}
+        instance.__dict__[self.field.attname] = value
+
+
+class LinkURLsField(JSONField):
+    """
+    Stores the resolved urls of a LinkField on the same model (default: "link") per language
+    to avoid looking up the link target when rendering.
+    """
+
+    def __init__(self, *args, link_field: str = "link", **kwargs):
+        kwargs.setdefault("default", dict)
+        kwargs.setdefault("blank", True)
+        kwargs.setdefault("editable", False)
+        self.link_field = link_field
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.link_field != "link":
+            kwargs["link_field"] = self.link_field
+        return name, path, args, kwargs
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        if not cls._meta.abstract and cls._meta.apps is apps:  # Skip historical models of migrations
+            stored_urls.register(cls, self.attname, self.link_field)
+            class_prepared.connect(self.add_link_descriptor, sender=cls, weak=False)
+
+    def add_link_descriptor(self, sender: type[models.Model], **kwargs) -> None:
+        """Replace the link field's descriptor once all fields of the model are known"""
+        setattr(sender, self.link_field, StoredURLsAttribute(sender._meta.get_field(self.link_field), self.attname))
+
+    def pre_save(self, model_instance: models.Model, add: bool):
+        if stored_urls.STORE_URLS:
+            stored_urls.refresh([model_instance], self.attname, self.link_field)
+        return super().pre_save(model_instance, add)
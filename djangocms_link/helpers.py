@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
 from django.apps import apps
+from django.conf import settings
 from django.contrib.sites.models import Site
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.http import HttpRequest
+from django.http.request import split_domain_port
+from django.utils.translation import get_language
+
+from djangocms_link import cache as link_cache
+from djangocms_link import snapshot as link_snapshot
 
 
 try:
@@ -11,6 +25,25 @@ except (ModuleNotFoundError, ImportError):  # pragma: no cover
     File = None
 
 
+# Request-scoped identity map: (model label, pk) -> object, and other per-request lookups
+_identity_map: ContextVar[dict | None] = ContextVar("djangocms_link_identity_map", default=None)
+
+
+@contextmanager
+def identity_map() -> Iterator[dict]:
+    """Within the context, each link target object is fetched at most once, and urls and the
+    current site are only determined once. ``LinkIdentityMapMiddleware`` enables it per request."""
+    objs = _identity_map.get()
+    if objs is not None:  # Already active
+        yield objs
+        return
+    token = _identity_map.set({})
+    try:
+        yield _identity_map.get()
+    finally:
+        _identity_map.reset(token)
+
+
 def get_manager(model: models.Model, current_content: bool = False) -> models.Manager:
     if hasattr(model, "admin_manager"):
         return (
@@ -21,30 +54,221 @@ def get_manager(model: models.Model, current_content: bool = False) -> models.Ma
     return model.objects
 
 
+# Link target models by the "app_label.model_name" prefix of references: (model, manager)
+_model_references: dict[str, tuple[type[models.Model], models.Manager]] = {}
+
+
+def get_model_reference(label: str) -> tuple[type[models.Model], models.Manager]:
+    """Return the model of a "app_label.model_name" reference prefix and the manager to fetch
+    link targets with (see ``get_manager``). Raises LookupError or ValueError for invalid labels."""
+    try:
+        return _model_references[label]
+    except KeyError:
+        model = apps.get_model(*label.split(".", 1))
+        _model_references[label] = model, get_manager(model)
+        return _model_references[label]
+
+
+def build_model_references(link_models: Iterable[type[models.Model]]) -> None:
+    """Fill the model reference registry once the app registry is ready. Other models are added
+    when they are first looked up."""
+    for model in link_models:
+        get_model_reference(model._meta.label_lower)
+
+
 def get_rel_obj(internal_link: str) -> models.Model | None:
     if ":" in internal_link:
-        model, pk = internal_link.split(":", 1)
+        label, pk = internal_link.split(":", 1)
         try:
-            model = apps.get_model(*model.split(".", 1))
-            return get_manager(model).filter(pk=pk).first()
+            model, manager = get_model_reference(label)
+            objs = _identity_map.get()
+            if objs is None:
+                return manager.filter(pk=pk).first()
+            key = (model._meta.label_lower, str(pk))
+            if key not in objs:
+                objs[key] = manager.filter(pk=pk).first()
+            return objs[key]
         except (LookupError, ValueError):
             return None
 
 
-def get_obj_link(obj: models.Model, site_id: int | None = None) -> str:
+def get_rel_reference(link_field_value: dict) -> str | None:
+    """Return the "app_label.model_name:pk" reference of an internal or file link."""
+    if "internal_link" in link_field_value:
+        return link_field_value["internal_link"]
+    if "file_link" in link_field_value:
+        return "filer.file:" + str(link_field_value["file_link"])
+    return None
+
+
+def get_rel_objs(internal_links: Iterable[str]) -> dict[str, models.Model | None]:
+    """Bulk version of ``get_rel_obj``: Fetches the objects with one query per model."""
+    objs, pending = {}, defaultdict(dict)
+    for internal_link in internal_links:
+        objs[internal_link] = None
+        if ":" in internal_link:
+            label, pk = internal_link.split(":", 1)
+            try:
+                model, manager = get_model_reference(label)
+                pending[model, manager][internal_link] = model._meta.pk.to_python(pk)
+            except (LookupError, ValueError, ValidationError):
+                pass
+    identity_map_objs = _identity_map.get()
+    for (model, manager), pks in pending.items():
+        if identity_map_objs is None:
+            in_bulk = manager.in_bulk(set(pks.values()))
+        else:
+            label = model._meta.label_lower
+            missing = {pk for pk in pks.values() if (label, str(pk)) not in identity_map_objs}
+            in_bulk = manager.in_bulk(missing) if missing else {}
+            for pk in missing:
+                identity_map_objs[label, str(pk)] = in_bulk.get(pk)
+            in_bulk = {pk: identity_map_objs[label, str(pk)] for pk in pks.values()}
+        for internal_link, pk in pks.items():
+            objs[internal_link] = in_bulk.get(pk)
+    return objs
+
+
+_site_domains: dict[int, str] | None = None
+_domain_sites: dict[str, int] = {}
+
+
+def get_site_domains() -> dict[int, str]:
+    """Return a map of all site ids to their domains. It is loaded once per process and
+    cleared whenever a site is saved or deleted."""
+    global _site_domains, _domain_sites
+    if _site_domains is None:
+        site_domains = dict(Site.objects.values_list("pk", "domain"))
+        _domain_sites = {domain.lower(): pk for pk, domain in site_domains.items()}
+        _site_domains = site_domains
+    return _site_domains
+
+
+def clear_site_domains(*args, **kwargs) -> None:
+    global _site_domains
+    _site_domains = None
+
+
+def get_site_domain(site_id: int) -> str:
+    domain = get_site_domains().get(site_id)
+    if domain is None:
+        # Site might have been added by another process
+        clear_site_domains()
+        domain = get_site_domains()[site_id]
+    return domain
+
+
+def get_current_site_id(request: HttpRequest | None = None) -> int:
+    """Return the current site's id like ``Site.objects.get_current`` but without db access."""
+    site_id = getattr(settings, "SITE_ID", None)
+    if site_id:
+        return site_id
+    objs = _identity_map.get()
+    key = ("site", request.get_host().lower() if request is not None else None)
+    if objs is not None and key in objs:
+        return objs[key]
+    if request is not None:
+        get_site_domains()
+        site_id = _domain_sites.get(key[1]) or _domain_sites.get(split_domain_port(key[1])[0])
+    if not site_id:
+        site_id = Site.objects.get_current(request).id
+    if objs is not None:
+        objs[key] = site_id
+    return site_id
+
+
+def get_obj_site_id(obj: models.Model) -> int | None:
     # Access site id if possible (no db access necessary)
-    if site_id is None:
-        site_id = Site.objects.get_current().id
-    obj_site_id = getattr(
+    return getattr(
         obj, "site_id", getattr(getattr(obj, "node", None), "site_id", None)
     )
-    link = obj.get_absolute_url()  # Can be None
+
+
+def add_site_domain(link: str | None, obj_site_id: int | None, site_id: int | None = None) -> str | None:
+    """Prepend the domain of the link target's site if it is not the current site."""
+    if site_id is None:
+        site_id = get_current_site_id()
     if link and obj_site_id and obj_site_id != site_id:
-        ref_site = Site.objects._get_site_by_id(obj_site_id).domain
-        link = f"//{ref_site}{link}"
+        link = f"//{get_site_domain(obj_site_id)}{link}"
     return link
 
 
+def get_obj_link(obj: models.Model, site_id: int | None = None) -> str:
+    if site_id is None:
+        site_id = get_current_site_id()
+    objs = _identity_map.get()
+    if objs is None or obj.pk is None:
+        return add_site_domain(obj.get_absolute_url(), get_obj_site_id(obj), site_id)  # Can be None
+    key = ("url", obj._meta.label_lower, str(obj.pk), site_id, get_language())
+    if key not in objs:
+        objs[key] = add_site_domain(obj.get_absolute_url(), get_obj_site_id(obj), site_id)
+    return objs[key]
+
+
+def get_absolute_urls(objs: Iterable[models.Model]) -> dict[tuple[str, object], str | None]:
+    """
+    Return the urls of all objects whose model implements the bulk url protocol, keyed by
+    (model label, pk): A classmethod ``get_absolute_urls(objs)`` returning the urls of a list of
+    instances in the current language (in the same order). It is called once per model.
+    """
+    by_model = defaultdict(list)
+    for obj in objs:
+        if hasattr(type(obj), "get_absolute_urls"):
+            by_model[type(obj)].append(obj)
+    urls = {}
+    for model, model_objs in by_model.items():
+        label = model._meta.label_lower
+        urls.update(((label, obj.pk), url) for obj, url in zip(model_objs, model.get_absolute_urls(model_objs)))
+    return urls
+
+
+def get_obj_links(objs: list[models.Model], site_id: int | None = None) -> list[str | None]:
+    """Bulk version of ``get_obj_link`` using ``get_absolute_urls`` where implemented."""
+    if site_id is None:
+        site_id = get_current_site_id()
+    urls = get_absolute_urls(objs)
+    return [
+        add_site_domain(urls[obj._meta.label_lower, obj.pk], get_obj_site_id(obj), site_id)
+        if (obj._meta.label_lower, obj.pk) in urls
+        else get_obj_link(obj, site_id)
+        for obj in objs
+    ]
+
+
+def _get_cache_key(site_id: int | None) -> tuple[int | None, str | None]:
+    # Without site id, links are resolved for the current site (no db access necessary)
+    return site_id if site_id is not None else getattr(settings, "SITE_ID", None), get_language()
+
+
+def get_cached_url(link_field_value: dict, site_id: int | None = None) -> tuple[bool, str | None]:
+    """Return if the link field value has a cached url for the site and the current language,
+    and the url. LinkDicts keep one cache slot per site and language, other dicts (and LinkDicts
+    with a ``__cache__`` key but no cache slots) have a single cache entry."""
+    url_cache = getattr(link_field_value, "url_cache", None)
+    if url_cache:
+        key = _get_cache_key(site_id)
+        return key in url_cache, url_cache.get(key)
+    if "__cache__" in link_field_value:
+        return True, link_field_value["__cache__"]
+    return False, None
+
+
+def set_cached_url(link_field_value: dict, url: str | None, site_id: int | None = None) -> str | None:
+    """Cache the url of a link field value for the site and the current language."""
+    if isinstance(link_field_value, LinkDict):
+        if link_field_value.url_cache is None:
+            link_field_value.url_cache = {}
+        link_field_value.url_cache[_get_cache_key(site_id)] = url
+    link_field_value["__cache__"] = url  # Most recently resolved url
+    return url
+
+
+def clear_cached_url(link_field_value: dict) -> None:
+    link_field_value.pop("__cache__", None)
+    if getattr(link_field_value, "url_cache", None):
+        link_field_value.url_cache.clear()
+
+
 def get_link(link_field_value: dict, site_id: int | None = None) -> str | None:
     if not link_field_value:
         return None
@@ -53,37 +277,103 @@ def get_link(link_field_value: dict, site_id: int | None = None) -> str | None:
             return link_field_value["external_link"].replace(" ", "")
         return link_field_value["external_link"] or None
 
-    if "__cache__" in link_field_value:
-        return link_field_value["__cache__"] or None
+    cached, url = get_cached_url(link_field_value, site_id)
+    if cached:
+        return url or None
 
-    if "internal_link" in link_field_value:
-        obj = get_rel_obj(link_field_value["internal_link"])
-    elif "file_link" in link_field_value:
-        obj = get_rel_obj("filer.file:" + str(link_field_value["file_link"]))
-    else:  # pragma: no cover
+    stored_url = getattr(link_field_value, "stored_urls", {}).get(get_language())
+    if stored_url is not None:
+        # Persisted by a LinkURLsField: [site id of the link target, url]
+        return set_cached_url(link_field_value, add_site_domain(stored_url[1], stored_url[0], site_id), site_id)
+
+    if get_rel_reference(link_field_value) is None:  # pragma: no cover
         return None
+    if not link_snapshot.resolve_from_snapshot([link_field_value], site_id):
+        return get_cached_url(link_field_value, site_id)[1]
+    link_cache.resolve_cached([link_field_value], site_id, partial(_resolve_each, site_id=site_id))
+    return get_cached_url(link_field_value, site_id)[1]
 
+
+def set_link_cache(link_field_value: dict, obj: models.Model | None, site_id: int | None = None) -> str | None:
+    """Store the url of the link target ``obj`` in the link field value's cache and return it."""
     if hasattr(obj, "get_absolute_url"):
-        link_field_value["__cache__"] = get_obj_link(obj, site_id)  # Can be None
-        if link_field_value["__cache__"]:
-            link_field_value["__cache__"] += link_field_value.get("anchor", "")
+        url = get_obj_link(obj, site_id)  # Can be None
+        if url:
+            url += link_field_value.get("anchor", "")
     elif hasattr(obj, "url"):
-        link_field_value["__cache__"] = obj.url
+        url = obj.url
     else:
-        link_field_value["__cache__"] = None
-    return link_field_value["__cache__"]
+        url = None
+    return set_cached_url(link_field_value, url, site_id)
+
+
+def resolve_links(link_field_values: Iterable[dict], site_id: int | None = None) -> None:
+    """Resolve the urls of many link field values at once and store them in their cache.
+
+    Instead of one query per link (as ``get_link`` would need), the targets of all internal
+    and file links are fetched with one query per model. External links and link field values
+    that already have a cached url are left untouched.
+    """
+    link_field_values = [
+        link_field_value for link_field_value in link_field_values
+        if link_field_value
+        and "external_link" not in link_field_value
+        and not get_cached_url(link_field_value, site_id)[0]
+        and get_rel_reference(link_field_value) is not None
+    ]
+    link_field_values = link_snapshot.resolve_from_snapshot(link_field_values, site_id)
+    if link_field_values:
+        link_cache.resolve_cached(link_field_values, site_id, partial(_resolve_bulk, site_id=site_id))
+
+
+def _resolve_each(link_field_values: list[dict], site_id: int | None = None) -> None:
+    from djangocms_link.page_urls import resolve_from_table
+
+    for link_field_value in resolve_from_table(link_field_values, site_id):
+        set_link_cache(link_field_value, get_rel_obj(get_rel_reference(link_field_value)), site_id)
+
+
+def set_link_caches(
+    link_field_values: list[dict], objs: dict[str, models.Model | None], site_id: int | None = None
+) -> None:
+    """Bulk version of ``set_link_cache``: ``objs`` maps the references of the link field values
+    to their link targets (see ``get_rel_objs``)."""
+    targets = list({id(obj): obj for obj in objs.values() if hasattr(obj, "get_absolute_url")}.values())
+    obj_links = {id(obj): link for obj, link in zip(targets, get_obj_links(targets, site_id))}
+    for link_field_value in link_field_values:
+        obj = objs[get_rel_reference(link_field_value)]
+        if id(obj) in obj_links:
+            url = obj_links[id(obj)]
+            set_cached_url(link_field_value, url + link_field_value.get("anchor", "") if url else url, site_id)
+        else:
+            set_link_cache(link_field_value, obj, site_id)
+
+
+def _resolve_bulk(link_field_values: list[dict], site_id: int | None = None) -> None:
+    from djangocms_link.page_urls import resolve_from_table
+
+    link_field_values = resolve_from_table(link_field_values, site_id)
+    objs = get_rel_objs(get_rel_reference(link_field_value) for link_field_value in link_field_values)
+    set_link_caches(link_field_values, objs, site_id)
 
 
 class LinkDict(dict):
     """dict subclass with two additional properties: url and type to easily infer the link type and
-    the url of the link. The url property is cached to avoid multiple db lookups."""
+    the url of the link. The url property is cached per site and language to avoid multiple db lookups."""
+
+    # Slots instead of an instance dict: Pages can hold many link field values. ``stored_urls`` and
+    # ``target`` are only set if available.
+    __slots__ = ("url_cache", "stored_urls", "target")
 
     def __init__(self, initial=None, **kwargs):
         anchor = kwargs.pop("anchor", None)
         super().__init__(**kwargs)
+        self.url_cache = None  # (site_id, language) -> url, created when the first url is cached
         if initial:
             if isinstance(initial, dict):
                 self.update(initial)
+                if getattr(initial, "url_cache", None):
+                    self.url_cache = dict(initial.url_cache)
             elif isinstance(initial, str):
                 self["external_link"] = initial
             elif isinstance(initial, File):
@@ -93,9 +383,17 @@ class LinkDict(dict):
                     f"{initial._meta.app_label}.{initial._meta.model_name}:{initial.pk}"
                 )
                 # Prepopulate cache since we have to object to get the URL
-                self["__cache__"] = initial.get_absolute_url()
-                if self["__cache__"] and anchor:
-                    self["__cache__"] += anchor
+                url = initial.get_absolute_url()
+                set_cached_url(self, url + anchor if url and anchor else url)
+
+    @classmethod
+    def from_dict(cls, value: dict) -> LinkDict:
+        """Fast constructor for decoded link field values, e.g., when loading rows from the
+        database. Skips the type checks of ``__init__``."""
+        link_dict = cls.__new__(cls)
+        dict.update(link_dict, value)
+        link_dict.url_cache = None
+        return link_dict
 
     @property
     def url(self) -> str:
@@ -0,0 +1,166 @@
+"""
+Database lookups for ``LinkField``: They compile to JSON path expressions, so that rows can
+be filtered by link target or link type in the database::
+
+    MyModel.objects.filter(link__points_to=page)
+    MyModel.objects.filter(link__target_model="cms.page")
+    MyModel.objects.filter(link__type="mailto")
+
+The lookups use ``LinkKey`` expressions. Indexes created by ``link_index`` contain the same
+expression, so that PostgreSQL and SQLite can use them instead of scanning the table. To let
+the index serve prefix matches (``target_model`` and ``type``), these compile to range
+conditions (``>= 'cms.page:' AND < 'cms.page;'``) on PostgreSQL and SQLite. On PostgreSQL, link
+keys use the "C" collation for the range to follow byte order.
+
+Links without the key do not match (the conditions are false and not NULL), so that ``exclude()``
+returns them.
+"""
+from __future__ import annotations
+
+from django.db import models
+from django.db.models import CharField, Func, Lookup
+
+from djangocms_link.helpers import get_model_reference
+
+
+try:
+    from filer.models import File
+except (ModuleNotFoundError, ImportError):  # pragma: no cover
+    File = None
+
+
+LINK_KEYS = ("internal_link", "file_link", "external_link", "anchor")
+EXTERNAL_PREFIXES = {"tel": "tel:", "mailto": "mailto:", "anchor": "#"}
+RANGE_VENDORS = ("postgresql", "sqlite")  # Compile prefix matches to ranges
+
+
+class LinkKey(Func):
+    """Text value of a top-level key of a link field. The JSON path is part of the SQL (and not a
+    parameter) for the expression to match expression indexes."""
+
+    output_field = CharField()
+
+    def __init__(self, key: str, expression, **extra):
+        if key not in LINK_KEYS:
+            raise ValueError(f"Unknown link key '{key}'.")
+        self.key = key
+        super().__init__(expression, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        # JSON_EXTRACT returns numbers for file links
+        return f"CAST(JSON_EXTRACT({sql}, '$.{self.key}') AS TEXT)", params
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"(({sql} ->> '{self.key}') COLLATE \"C\")", params
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"JSON_UNQUOTE(JSON_EXTRACT({sql}, '$.{self.key}'))", params
+
+    def as_oracle(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        return f"JSON_VALUE({sql}, '$.{self.key}')", params
+
+
+def link_index(field_name: str, key: str, name: str) -> models.Index:
+    """Return an expression index on a link field's key (e.g., "internal_link") to be added to a
+    model's ``Meta.indexes``. It is used by the ``points_to`` lookup (for internal links or file
+    links, respectively) and, on PostgreSQL and SQLite, by the ``target_model`` and ``type``
+    lookups."""
+    return models.Index(LinkKey(key, field_name), name=name)
+
+
+def get_link_reference(obj) -> str:
+    """Turn a model instance into its "app_label.model_name:pk" reference (``filer.file:pk`` for files)."""
+    if File is not None and isinstance(obj, File):
+        return f"filer.file:{obj.pk}"
+    if isinstance(obj, models.Model):
+        return f"{obj._meta.label_lower}:{obj.pk}"
+    return obj
+
+
+class LinkLookup(Lookup):
+    prepare_rhs = False
+
+    def key_sql(self, key: str, compiler, connection):
+        return compiler.compile(LinkKey(key, self.lhs))
+
+    def condition_sql(self, key: str, conditions: list[tuple[str, str]], compiler, connection):
+        """Conditions ``(operator, value)`` on the key's value, combined with AND. They are false
+        (not NULL) if the link does not have the key: NOT on a NULL condition is NULL, which would
+        drop the link from ``exclude()`` results."""
+        sql, params = self.key_sql(key, compiler, connection)
+        parts, all_params = [f"{sql} IS NOT NULL"], list(params)
+        for operator, value in conditions:
+            parts.append(f"{sql} {operator}")
+            all_params += [*params, value]
+        return f"({' AND '.join(parts)})", all_params
+
+    def prefix_sql(self, key: str, prefix: str, compiler, connection):
+        """Values of the key starting with ``prefix`` (any value for an empty prefix)."""
+        if connection.vendor not in RANGE_VENDORS:
+            if not prefix:
+                return self.condition_sql(key, [], compiler, connection)
+            pattern = connection.ops.prep_for_like_query(prefix) + "%"
+            operator = connection.operators["startswith"] % "%s"
+            return self.condition_sql(key, [(operator, pattern)], compiler, connection)
+        # A range can be served by an index, unlike LIKE
+        if not prefix:
+            return self.condition_sql(key, [(">= %s", "")], compiler, connection)
+        end = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return self.condition_sql(key, [(">= %s", prefix), ("< %s", end)], compiler, connection)
+
+
+class PointsTo(LinkLookup):
+    """Links to a model instance or a "app_label.model_name:pk" reference."""
+
+    lookup_name = "points_to"
+
+    def as_sql(self, compiler, connection):
+        reference = get_link_reference(self.rhs)
+        if reference.startswith("filer.file:"):
+            key, value = "file_link", reference.split(":", 1)[1]
+        else:
+            key, value = "internal_link", reference
+        return self.condition_sql(key, [("= %s", value)], compiler, connection)
+
+
+class TargetModel(LinkLookup):
+    """Internal links to a model given by its label (e.g., "cms.page") or class."""
+
+    lookup_name = "target_model"
+
+    def as_sql(self, compiler, connection):
+        if isinstance(self.rhs, str):
+            label = self.rhs.lower()
+            try:
+                model = get_model_reference(label)[0]
+            except (LookupError, ValueError):
+                model = None
+        else:
+            model, label = self.rhs, self.rhs._meta.label_lower
+        if File is not None and model is not None and issubclass(model, File):
+            return self.prefix_sql("file_link", "", compiler, connection)
+        return self.prefix_sql("internal_link", f"{label}:", compiler, connection)
+
+
+class LinkType(LinkLookup):
+    """Links of a type as returned by ``LinkDict.type``, e.g., "internal_link" or "tel"."""
+
+    lookup_name = "type"
+
+    def as_sql(self, compiler, connection):
+        if self.rhs in ("internal_link", "file_link", "external_link"):
+            sql, params = self.prefix_sql(self.rhs, "", compiler, connection)
+            if self.rhs == "external_link":
+                # Other external links are phone numbers, email addresses or anchors
+                for prefix in EXTERNAL_PREFIXES.values():
+                    prefix_sql, prefix_params = self.prefix_sql("external_link", prefix, compiler, connection)
+                    sql, params = f"{sql} AND NOT {prefix_sql}", [*params, *prefix_params]
+                sql = f"({sql})"
+            return sql, params
+        if self.rhs in EXTERNAL_PREFIXES:
+            return self.prefix_sql("external_link", EXTERNAL_PREFIXES[self.rhs], compiler, connection)
+        raise ValueError(f"Unknown link type '{self.rhs}'.")
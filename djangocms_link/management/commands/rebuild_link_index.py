@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from djangocms_link import references
+
+
+class Command(BaseCommand):
+    help = "Rebuild the reverse link index recording which link fields point to which objects."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=references.BATCH_SIZE,
+            help="Number of rows processed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        count = references.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} link references."))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from djangocms_link import page_urls
+
+
+class Command(BaseCommand):
+    help = "Rebuild the materialized page urls of all pages and languages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=page_urls.BATCH_SIZE,
+            help="Number of pages processed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        count = page_urls.rebuild(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Stored {count} page urls."))
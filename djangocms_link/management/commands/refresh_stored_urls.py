@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from djangocms_link import stored_urls
+
+
+class Command(BaseCommand):
+    help = "Refresh the stored link urls of all models with a LinkURLsField."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=stored_urls.BATCH_SIZE,
+            help="Number of rows processed per batch.",
+        )
+
+    def handle(self, *args, **options):
+        count = stored_urls.refresh_all(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Refreshed the stored urls of {count} rows."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from djangocms_link import snapshot
+
+
+class Command(BaseCommand):
+    help = "Write a snapshot of the urls of all link targets for workers to read through mmap."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=snapshot.SNAPSHOT,
+            help="Path of the snapshot file (defaults to the DJANGOCMS_LINK_SNAPSHOT setting).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=snapshot.BATCH_SIZE,
+            help="Number of link targets fetched per query.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["path"]:
+            raise CommandError("Set DJANGOCMS_LINK_SNAPSHOT or pass --path.")
+        count = snapshot.build(options["path"], batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {count} link urls to {options['path']}."))
@@ -0,0 +1,61 @@
+"""
+Page urls from the CMS menu: django CMS caches the navigation nodes of each site and language,
+including the urls of all pages shown to the current user. If
+``DJANGOCMS_LINK_MENU_URLS`` is set to ``True``, page links are resolved from these nodes
+when link plugins are rendered. Only pages missing in the menu (e.g., pages hidden from the
+current user) are looked up in the database.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.http import HttpRequest
+from django.utils.translation import get_language
+
+from djangocms_link.helpers import get_cached_url, set_cached_url
+
+
+MENU_URLS = getattr(settings, "DJANGOCMS_LINK_MENU_URLS", False)
+PAGE_PREFIX = "cms.page:"
+
+
+def get_menu_urls(request: HttpRequest) -> tuple[int | None, dict[int, str]]:
+    """Return the site id of the menu and its page urls by page pk for the current language. The
+    nodes are read once per request and language from the menu cache (and built if it is cold)."""
+    from menus.menu_pool import menu_pool
+
+    language = get_language()
+    menu_urls = request.__dict__.setdefault("_djangocms_link_menu_urls", {})
+    if language not in menu_urls:
+        renderer = menu_pool.get_renderer(request)
+        if getattr(renderer, "edit_or_preview", False) or renderer.request_language != language:
+            # Node urls are preview urls or in another language
+            menu_urls[language] = None, {}
+        else:
+            menu_urls[language] = renderer.site.pk, {
+                node.id: node.get_absolute_url()
+                for node in renderer.get_nodes()
+                if node.attr.get("is_page") and not getattr(node, "language", None)  # Skip fallbacks
+            }
+    return menu_urls[language]
+
+
+def resolve_from_menu(request: HttpRequest, link_field_values: Iterable[dict], site_id: int | None = None) -> None:
+    """Cache the urls of page links found in the menu. Other link field values are left untouched."""
+    page_links = [
+        link_field_value for link_field_value in link_field_values
+        if link_field_value
+        and link_field_value.get("internal_link", "").startswith(PAGE_PREFIX)
+        and not get_cached_url(link_field_value, site_id)[0]
+    ]
+    if not page_links:
+        return
+    menu_site_id, urls = get_menu_urls(request)
+    if site_id is not None and site_id != menu_site_id:
+        return
+    for link_field_value in page_links:
+        pk = link_field_value["internal_link"][len(PAGE_PREFIX):]
+        url = urls.get(int(pk)) if pk.isdigit() else None
+        if url is not None:
+            set_cached_url(link_field_value, url + link_field_value.get("anchor", ""), site_id)
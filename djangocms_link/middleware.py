@@ -0,0 +1,37 @@
+from djangocms_link import deferred
+from djangocms_link.helpers import get_current_site_id, identity_map
+
+
+class LinkIdentityMapMiddleware:
+    """Fetch each link target at most once per request (see ``djangocms_link.helpers.identity_map``)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with identity_map():
+            return self.get_response(request)
+
+
+class DeferredLinksMiddleware:
+    """Resolve the urls of all links rendered into a response at once (see ``djangocms_link.deferred``)."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not deferred.DEFERRED_LINKS:
+            return self.get_response(request)
+        with deferred.deferred_links():
+            response = self.get_response(request)
+        content_type = response.get("Content-Type", "")
+        if not response.streaming and content_type.startswith("text/"):
+            response.content = deferred.substitute(
+                response.content,
+                get_current_site_id(request),
+                charset=response.charset,
+                html=content_type.startswith("text/html"),
+            )
+            if response.has_header("Content-Length"):
+                response["Content-Length"] = str(len(response.content))
+        return response
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:37
+
+from django.db import migrations
+
+import djangocms_link.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('djangocms_link', '0020_rename_target_link_link_target'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='link',
+            name='link_urls',
+            field=djangocms_link.fields.LinkURLsField(blank=True, default=dict, editable=False, verbose_name='Link urls'),
+        ),
+    ]
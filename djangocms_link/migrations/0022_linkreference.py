@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 13:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('djangocms_link', '0021_link_link_urls'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LinkReference',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_id', models.CharField(max_length=255)),
+                ('source_id', models.CharField(max_length=255)),
+                ('field_name', models.CharField(max_length=255)),
+                ('source_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+                ('target_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Link reference',
+                'verbose_name_plural': 'Link references',
+                'indexes': [models.Index(fields=['target_type', 'target_id'], name='djangocms_link_target_idx'), models.Index(fields=['source_type', 'source_id'], name='djangocms_link_source_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 14:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cms', '0022_auto_20180620_1551'),
+        ('djangocms_link', '0022_linkreference'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MaterializedPageURL',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('site_id', models.PositiveIntegerField(null=True)),
+                ('language', models.CharField(max_length=15)),
+                ('url', models.CharField(max_length=2048, null=True)),
+                ('page', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='cms.page')),
+            ],
+            options={
+                'verbose_name': 'Page url',
+                'verbose_name_plural': 'Page urls',
+                'constraints': [models.UniqueConstraint(fields=('page', 'language'), name='djangocms_link_page_url_unique')],
+            },
+        ),
+    ]
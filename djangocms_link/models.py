@@ -6,19 +6,22 @@ using the HTML <a> tag.
 import warnings
 
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.query import ModelIterable
+from django.db.models.signals import class_prepared
 from django.utils.encoding import force_str
 from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import override
 
-from cms.models import CMSPlugin
+from cms.models import CMSPlugin, Page
 
 from djangocms_attributes_field.fields import AttributesField
 
-from .fields import LinkField
-from .helpers import get_link
+from .fields import LinkField, LinkURLsField
+from .helpers import LinkDict, get_link, get_rel_objs, get_rel_reference, set_link_caches
 from .validators import IntranetURLValidator
 
 
@@ -140,11 +143,145 @@ class AbstractLink(CMSPlugin):
                 code="required",
             )
 
-    def __init__(self, *args, **wkargs):
-        super().__init__(*args, **wkargs)
+    def clean_fields(self, exclude=None):
+        # link_is_optional might have been changed after the class was created
         self._meta.get_field("link").blank = self.link_is_optional
+        super().clean_fields(exclude)
+
+
+def set_link_blank(sender, **kwargs):
+    """Let the link field of AbstractLink subclasses follow their link_is_optional attribute. This is
+    done once when the model class is created, not when its instances are created."""
+    if issubclass(sender, AbstractLink) and not sender._meta.abstract:
+        sender._meta.get_field("link").blank = sender.link_is_optional
+
+
+class_prepared.connect(set_link_blank, dispatch_uid="djangocms_link_set_link_blank")
 
 
 class Link(AbstractLink):
+    # Resolved urls of the link, only maintained if DJANGOCMS_LINK_STORE_URLS is True
+    link_urls = LinkURLsField(
+        verbose_name=_("Link urls"),
+        link_field="link",
+    )
+
     class Meta:
         abstract = False
+
+
+class LinkQuerySet(models.QuerySet):
+    """QuerySet for models with LinkFields. Use ``LinkQuerySet.as_manager()`` as manager."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetch_link_fields = ()
+
+    def prefetch_links(self, *field_names):
+        """Fetch the link targets of the given LinkFields of all rows with one query per target
+        model when the queryset is evaluated. The targets are available as the ``target`` attribute
+        of the LinkDicts and their urls are cached. ``prefetch_links(None)`` clears the list."""
+        clone = self._chain()
+        if field_names == (None,):
+            clone._prefetch_link_fields = ()
+        else:
+            for field_name in field_names:
+                if not isinstance(self.model._meta.get_field(field_name), LinkField):
+                    raise ValueError(f"'{field_name}' is not a LinkField.")
+            clone._prefetch_link_fields = self._prefetch_link_fields + tuple(
+                field_name for field_name in field_names if field_name not in self._prefetch_link_fields
+            )
+        return clone
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._prefetch_link_fields = self._prefetch_link_fields
+        return clone
+
+    def _fetch_all(self):
+        prefetch = self._result_cache is None and issubclass(self._iterable_class, ModelIterable)
+        super()._fetch_all()
+        if prefetch and self._prefetch_link_fields:
+            self._prefetch_link_targets()
+
+    def _prefetch_link_targets(self):
+        link_field_values = []
+        for obj in self._result_cache:
+            for field_name in self._prefetch_link_fields:
+                link_field_value = getattr(obj, field_name)
+                if (
+                    isinstance(link_field_value, LinkDict)
+                    and "external_link" not in link_field_value
+                    and get_rel_reference(link_field_value) is not None
+                ):
+                    link_field_values.append(link_field_value)
+        objs = get_rel_objs(get_rel_reference(link_field_value) for link_field_value in link_field_values)
+        for link_field_value in link_field_values:
+            link_field_value.target = objs[get_rel_reference(link_field_value)]
+        set_link_caches(link_field_values, objs)
+
+
+class LinkReferenceQuerySet(models.QuerySet):
+    def pointing_to(self, obj):
+        """Filter for references to a model instance or a "app_label.model_name:pk" reference."""
+        if isinstance(obj, models.Model):
+            return self.filter(target_type=ContentType.objects.get_for_model(obj), target_id=str(obj.pk))
+        model, pk = obj.split(":", 1)
+        app_label, model_name = model.split(".", 1)
+        return self.filter(target_type__app_label=app_label, target_type__model=model_name, target_id=pk)
+
+    def sources(self):
+        """Return the objects with link fields pointing to the references' targets. Requires
+        one query per model."""
+        pks = {}
+        for source_type_id, source_id in self.values_list("source_type_id", "source_id"):
+            pks.setdefault(source_type_id, set()).add(source_id)
+        objs = []
+        for source_type_id, source_ids in pks.items():
+            model = ContentType.objects.get_for_id(source_type_id).model_class()
+            if model is not None:
+                objs += model._base_manager.filter(pk__in=source_ids)
+        return objs
+
+
+class LinkReference(models.Model):
+    """Reverse link index: Records which LinkField of which object links to which target."""
+
+    target_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name="+")
+    target_id = models.CharField(max_length=255)
+    source_type = models.ForeignKey(ContentType, on_delete=models.CASCADE, related_name="+")
+    source_id = models.CharField(max_length=255)
+    field_name = models.CharField(max_length=255)
+
+    objects = LinkReferenceQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("Link reference")
+        verbose_name_plural = _("Link references")
+        indexes = [
+            models.Index(fields=["target_type", "target_id"], name="djangocms_link_target_idx"),
+            models.Index(fields=["source_type", "source_id"], name="djangocms_link_source_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.source_type.app_label}.{self.source_type.model}:{self.source_id} ({self.field_name})"
+
+
+class MaterializedPageURL(models.Model):
+    """Materialized page urls: The absolute url of a page per language, only maintained if
+    ``DJANGOCMS_LINK_PAGE_URLS`` is True."""
+
+    page = models.ForeignKey(Page, on_delete=models.CASCADE, related_name="+")
+    site_id = models.PositiveIntegerField(null=True)
+    language = models.CharField(max_length=15)
+    url = models.CharField(max_length=2048, null=True)
+
+    class Meta:
+        verbose_name = _("Page url")
+        verbose_name_plural = _("Page urls")
+        constraints = [
+            models.UniqueConstraint(fields=["page", "language"], name="djangocms_link_page_url_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.page_id} ({self.language}): {self.url}"
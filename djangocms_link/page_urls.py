@@ -0,0 +1,196 @@
+"""
+Materialized page urls: The ``MaterializedPageURL`` table holds the absolute url of each page
+per language together with the page's site. Page links and the page listing of the link
+autocomplete endpoint read their urls from it with one query instead of fetching the pages
+and their url records.
+
+Rows are rewritten when a page, its content or its url records are saved, and after page
+operations in the admin (e.g., changing a slug or moving a page) or publishing. A changed page
+path or slug also changes the urls of all its descendants, so these are rewritten, too. Moving
+pages with ``Page.move_page()`` outside the admin does not send signals. The ``rebuild_page_urls``
+management command recreates the whole table (e.g., after such moves or bulk operations).
+
+The table is only maintained and used if ``DJANGOCMS_LINK_PAGE_URLS`` is set to ``True``.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from functools import partial
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models.signals import post_delete
+from django.utils.translation import get_language, override
+
+from djangocms_link.helpers import add_site_domain, get_obj_site_id, set_cached_url
+from djangocms_link.signals import (
+    connect_model_signals, connect_page_operation_signals, track_url_changes, url_changed,
+)
+
+
+PAGE_URLS = getattr(settings, "DJANGOCMS_LINK_PAGE_URLS", False)
+PAGE_PREFIX = "cms.page:"
+BATCH_SIZE = 500
+
+
+def get_pages(pks: Iterable[int] | None = None) -> models.QuerySet:
+    from cms.models import Page
+
+    qs = Page._base_manager.order_by("pk")
+    if hasattr(Page, "urls"):
+        qs = qs.prefetch_related("urls")  # django CMS 4.1+: Url records by language
+    if any(field.name == "node" for field in Page._meta.concrete_fields):
+        qs = qs.select_related("node")  # django CMS 3.11 and 4.1: Site of the page
+    return qs if pks is None else qs.filter(pk__in=pks)
+
+
+def get_rows(pages: Iterable[models.Model]) -> Iterator[models.Model]:
+    from djangocms_link.models import MaterializedPageURL
+
+    languages = [code for code, _name in settings.LANGUAGES]
+    for page in pages:
+        site_id = get_obj_site_id(page)
+        for language in languages:
+            with override(language):
+                url = page.get_absolute_url()  # Can be None
+            yield MaterializedPageURL(page=page, site_id=site_id, language=language, url=url)
+
+
+def refresh_pages(pks: Iterable[int], batch_size: int = BATCH_SIZE) -> None:
+    """Rewrite the rows of the pages with the given pks."""
+    from djangocms_link.models import MaterializedPageURL
+
+    pks = list(pks)
+    for start in range(0, len(pks), batch_size):
+        batch = pks[start:start + batch_size]
+        with transaction.atomic():
+            MaterializedPageURL.objects.filter(page_id__in=batch).delete()
+            MaterializedPageURL.objects.bulk_create(get_rows(get_pages(batch)), batch_size=batch_size)
+
+
+def refresh_subtree(page: models.Model) -> None:
+    """A page's url change affects the urls of its descendants, too."""
+    refresh_pages([page.pk, *page.get_descendant_pages().values_list("pk", flat=True)])
+
+
+def rebuild(batch_size: int = BATCH_SIZE) -> int:
+    """Recreate the table in chunks of ``batch_size`` pages and return the number of rows."""
+    from djangocms_link.models import MaterializedPageURL
+
+    MaterializedPageURL.objects.all().delete()
+    qs = get_pages()
+    count, last_pk = 0, None
+    while True:
+        batch = list((qs.filter(pk__gt=last_pk) if last_pk is not None else qs)[:batch_size])
+        if not batch:
+            break
+        count += len(MaterializedPageURL.objects.bulk_create(get_rows(batch), batch_size=batch_size))
+        if len(batch) < batch_size:
+            break
+        last_pk = batch[-1].pk
+    return count
+
+
+def get_urls(pks: Iterable[int], language: str | None = None) -> dict[int, tuple[int | None, str | None]]:
+    """Return the site id and url of the pages with the given pks by page pk (current language
+    by default). Pages without a row are missing."""
+    from djangocms_link.models import MaterializedPageURL
+
+    return {
+        page_id: (site_id, url)
+        for page_id, site_id, url in MaterializedPageURL.objects.filter(
+            page_id__in=set(pks), language=language or get_language()
+        ).values_list("page_id", "site_id", "url")
+    }
+
+
+def get_language_urls(pks: Iterable[int]) -> dict[tuple[int, str], str | None]:
+    """Return the urls of the pages with the given pks in all languages by (page pk, language)."""
+    from djangocms_link.models import MaterializedPageURL
+
+    return {
+        (page_id, language): url
+        for page_id, language, url in MaterializedPageURL.objects.filter(page_id__in=set(pks)).values_list(
+            "page_id", "language", "url"
+        )
+    }
+
+
+def resolve_from_table(link_field_values: list[dict], site_id: int | None = None) -> list[dict]:
+    """Cache the urls of page links found in the table and return all other link field values."""
+    if not PAGE_URLS:
+        return link_field_values
+    page_links, others = {}, []
+    for link_field_value in link_field_values:
+        pk = link_field_value.get("internal_link", "")[len(PAGE_PREFIX):]
+        if link_field_value.get("internal_link", "").startswith(PAGE_PREFIX) and pk.isdigit():
+            page_links.setdefault(int(pk), []).append(link_field_value)
+        else:
+            others.append(link_field_value)
+    if not page_links:
+        return others
+    urls = get_urls(page_links)
+    for pk, values in page_links.items():
+        if pk not in urls:
+            others += values
+            continue
+        obj_site_id, url = urls[pk]
+        url = add_site_domain(url, obj_site_id, site_id)
+        for link_field_value in values:
+            set_cached_url(link_field_value, url + link_field_value.get("anchor", "") if url else url, site_id)
+    return others
+
+
+def refresh_page(pk: int, descendants: bool = True) -> None:
+    from cms.models import Page
+
+    if not descendants:
+        refresh_pages([pk])
+        return
+    page = Page._base_manager.filter(pk=pk).first()
+    if page:
+        refresh_subtree(page)
+
+
+def refresh_target(sender: type[models.Model], instance: models.Model, **kwargs) -> None:
+    if not PAGE_URLS or kwargs.get("raw"):
+        return
+
+    from cms.models import Page
+
+    if kwargs.get("signal") is post_delete:
+        # Rows of deleted pages are deleted with them. Content or url records are deleted before
+        # their page if it is deleted, too: Only refresh a remaining page.
+        if not isinstance(instance, Page) and getattr(instance, "page_id", None):
+            transaction.on_commit(partial(refresh_page, instance.page_id))
+    elif isinstance(instance, Page):
+        if url_changed(instance, **kwargs):
+            refresh_subtree(instance)
+        else:
+            refresh_pages([instance.pk])
+    elif getattr(instance, "page_id", None):
+        # Page content, title or url records
+        refresh_page(instance.page_id, url_changed(instance, **kwargs))
+
+
+def refresh_page_operation(page: models.Model | None) -> None:
+    if PAGE_URLS and page is not None:
+        refresh_page(page.pk)  # The page might have been deleted
+
+
+def connect_signals() -> None:
+    """Keep the table current if a page changes (only if ``PAGE_URLS`` is set)."""
+    from django.apps import apps
+
+    if not PAGE_URLS:
+        return
+
+    cms_models = apps.get_app_config("cms").models_module
+    target_models = [
+        getattr(cms_models, model_name)
+        for model_name in ("Page", "PageContent", "Title", "PageUrl")
+        if hasattr(cms_models, model_name)
+    ]
+    track_url_changes(target_models)
+    connect_model_signals(refresh_target, target_models, "djangocms_link_page_urls")
+    connect_page_operation_signals(refresh_page_operation, "djangocms_link_page_urls")
@@ -0,0 +1,137 @@
+"""
+Reverse link index: The ``LinkReference`` table records which rows (and which of their
+``LinkField`` fields) link to which object. It is kept up to date when a model instance with
+a ``LinkField`` is saved or deleted, and can be rebuilt with the ``rebuild_link_index``
+management command (e.g., after bulk operations that do not send signals).
+
+The index is only maintained if ``DJANGOCMS_LINK_INDEX_LINKS`` is set to ``True``.
+"""
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+
+from djangocms_link.helpers import get_model_reference, get_rel_reference
+
+
+INDEX_LINKS = getattr(settings, "DJANGOCMS_LINK_INDEX_LINKS", False)
+BATCH_SIZE = 500
+
+# Concrete models with LinkFields: model -> names of its LinkFields
+_registry: dict[type[models.Model], list[str]] = defaultdict(list)
+
+
+def register(model: type[models.Model], field_name: str) -> None:
+    if field_name not in _registry[model]:
+        _registry[model].append(field_name)
+
+
+def connect_signals() -> None:
+    """Keep the index current for all registered models (only if ``INDEX_LINKS`` is set)."""
+    if not INDEX_LINKS:
+        return
+    for model in _registry:
+        label = model._meta.label
+        post_save.connect(update_references, sender=model, dispatch_uid=f"djangocms_link_index_{label}")
+        post_delete.connect(delete_references, sender=model, dispatch_uid=f"djangocms_link_unindex_{label}")
+
+
+def get_target(reference: str | None) -> tuple[ContentType, str] | None:
+    """Turn a "app_label.model_name:pk" reference into the target's content type and pk."""
+    if not reference or ":" not in reference:
+        return None
+    label, pk = reference.split(":", 1)
+    try:
+        model = get_model_reference(label)[0]
+    except (LookupError, ValueError):
+        return None
+    return ContentType.objects.get_for_model(model), pk
+
+
+def get_references(model: type[models.Model], instances: Iterable[models.Model]) -> Iterator:
+    from djangocms_link.models import LinkReference
+
+    source_type = ContentType.objects.get_for_model(model)
+    for instance in instances:
+        for field_name in _registry[model]:
+            link = getattr(instance, field_name) or {}
+            target = None if "external_link" in link else get_target(get_rel_reference(link))
+            if target:
+                yield LinkReference(
+                    target_type=target[0],
+                    target_id=target[1],
+                    source_type=source_type,
+                    source_id=str(instance.pk),
+                    field_name=field_name,
+                )
+
+
+def update_references(sender: type[models.Model], instance: models.Model, update_fields=None, **kwargs) -> None:
+    if not INDEX_LINKS or kwargs.get("raw"):
+        return
+    if update_fields is not None and not set(update_fields) & set(_registry[sender]):
+        return
+    from djangocms_link.models import LinkReference
+
+    with transaction.atomic():
+        LinkReference.objects.filter(
+            source_type=ContentType.objects.get_for_model(sender), source_id=str(instance.pk)
+        ).delete()
+        LinkReference.objects.bulk_create(get_references(sender, [instance]))
+
+
+def delete_references(sender: type[models.Model], instance: models.Model, **kwargs) -> None:
+    if not INDEX_LINKS:
+        return
+    from djangocms_link.models import LinkReference
+
+    LinkReference.objects.filter(
+        source_type=ContentType.objects.get_for_model(sender), source_id=str(instance.pk)
+    ).delete()
+
+
+def get_source_ids(model: type[models.Model], field_name: str, references: Iterable[str]) -> list[str]:
+    """Return the pks of ``model`` rows whose field ``field_name`` links to one of the references."""
+    from djangocms_link.models import LinkReference
+
+    targets = defaultdict(list)
+    for reference in references:
+        target = get_target(reference)
+        if target:
+            targets[target[0]].append(target[1])
+    if not targets:
+        return []
+    query = models.Q()
+    for target_type, target_ids in targets.items():
+        query |= models.Q(target_type=target_type, target_id__in=target_ids)
+    return list(
+        LinkReference.objects.filter(query)
+        .filter(source_type=ContentType.objects.get_for_model(model), field_name=field_name)
+        .values_list("source_id", flat=True)
+    )
+
+
+def rebuild(batch_size: int = BATCH_SIZE) -> int:
+    """Rebuild the reverse link index in chunks of ``batch_size`` rows and return the number of references."""
+    from djangocms_link.models import LinkReference
+
+    count = 0
+    for model in _registry:
+        source_type = ContentType.objects.get_for_model(model)
+        LinkReference.objects.filter(source_type=source_type).delete()
+        qs = model._base_manager.only("pk", *_registry[model]).order_by("pk")
+        last_pk = None
+        while True:
+            batch = list((qs.filter(pk__gt=last_pk) if last_pk is not None else qs)[:batch_size])
+            if not batch:
+                break
+            count += len(LinkReference.objects.bulk_create(get_references(model, batch), batch_size=batch_size))
+            if len(batch) < batch_size:
+                break
+            last_pk = batch[-1].pk
+    return count
@@ -0,0 +1,88 @@
+"""
+Signal wiring shared by the subsystems keeping link urls current (the url cache, stored urls,
+materialized page urls and the snapshot), and the check whether a page change affects the urls
+of its descendants.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from django.db import models
+from django.db.models.signals import post_delete, post_init, post_save
+
+
+PAGE_OPERATION_SIGNALS = ("post_obj_operation", "post_publish", "post_unpublish", "page_moved")
+# Fields of pages and their url records (content in CMS 3) which the urls of the descendants depend on
+URL_FIELDS = ("path", "slug", "parent", "node", "is_home", "site")
+URL_VALUES = "_djangocms_link_url_values"
+MISSING = object()
+
+_url_fields: dict[type[models.Model], dict[str, str]] = {}  # Model -> url field names and attnames
+
+
+def connect_model_signals(receiver: Callable, target_models: Iterable[type[models.Model]], dispatch_uid: str) -> None:
+    """Call ``receiver`` (a ``post_save`` and ``post_delete`` receiver) if one of the
+    ``target_models`` is saved or deleted."""
+    for model in target_models:
+        post_save.connect(receiver, sender=model, dispatch_uid=f"{dispatch_uid}_{model._meta.label}")
+        post_delete.connect(receiver, sender=model, dispatch_uid=f"{dispatch_uid}_delete_{model._meta.label}")
+
+
+def connect_page_operation_signals(receiver: Callable[[models.Model | None], None], dispatch_uid: str) -> None:
+    """Call ``receiver(page)`` after page operations (CMS 4+), publishing, unpublishing and moving
+    (CMS 3) and version operations (djangocms-versioning). These can change page urls in bulk
+    without sending ``post_save`` signals. ``page`` is None if the operation is not about a page."""
+    from cms import signals as cms_signals
+    from cms.models import Page
+
+    def page_operation(sender, obj=None, instance=None, **kwargs):
+        obj = obj or instance  # CMS 3 signals send the page as instance
+        page = getattr(obj, "page", obj)  # CMS 4 operations can send the page content
+        receiver(page if isinstance(page, Page) else None)
+
+    def version_operation(sender, obj=None, **kwargs):
+        page_operation(sender, getattr(obj, "content", None))
+
+    for name in PAGE_OPERATION_SIGNALS:
+        signal = getattr(cms_signals, name, None)
+        if signal is not None and not hasattr(signal, "_deprecation_name"):
+            signal.connect(page_operation, dispatch_uid=f"{dispatch_uid}_{name}", weak=False)
+    try:
+        from djangocms_versioning.signals import post_version_operation
+
+        post_version_operation.connect(version_operation, dispatch_uid=f"{dispatch_uid}_version", weak=False)
+    except (ModuleNotFoundError, ImportError):
+        pass
+
+
+def get_url_values(instance: models.Model) -> tuple:
+    return tuple(instance.__dict__.get(attname, MISSING) for attname in _url_fields[type(instance)].values())
+
+
+def remember_url_values(sender: type[models.Model], instance: models.Model, **kwargs) -> None:
+    instance.__dict__[URL_VALUES] = get_url_values(instance)
+
+
+def track_url_changes(target_models: Iterable[type[models.Model]]) -> None:
+    """Remember the url fields of loaded pages and url records for ``url_changed``."""
+    for model in target_models:
+        fields = {field.name: field.attname for field in model._meta.concrete_fields if field.name in URL_FIELDS}
+        if fields and model._meta.app_label == "cms":
+            _url_fields[model] = fields
+            uid = f"djangocms_link_urls_{model._meta.label}"
+            post_init.connect(remember_url_values, sender=model, dispatch_uid=uid)
+
+
+def url_changed(instance: models.Model, created: bool = False, update_fields=None, **kwargs) -> bool:
+    """Whether saving or deleting ``instance`` (a page or its url record) can change the urls of
+    the page's descendants: Saves only do if they change one of the ``URL_FIELDS`` compared to
+    the values when the instance was loaded. Unknown (e.g., deferred) values count as changed."""
+    fields = _url_fields.get(type(instance))
+    if not fields:
+        return False
+    if created or kwargs.get("signal") is post_delete:
+        return True
+    if update_fields is not None and not set(fields) & set(update_fields):
+        return False
+    old_values = instance.__dict__.get(URL_VALUES)
+    return old_values is None or MISSING in old_values or old_values != get_url_values(instance)
@@ -0,0 +1,217 @@
+"""
+Link target snapshot: A binary file mapping the references of all link targets ("cms.page:1",
+"filer.file:2", ...) and each language to the target's site and url. It is written by the
+``write_link_snapshot`` management command and read through ``mmap``: Workers do not load
+the snapshot into their own memory but share the operating system's page cache, and forked
+workers share a snapshot opened before forking.
+
+``get_link`` and ``resolve_links`` look up urls in the snapshot before querying the database.
+Each snapshot has a generation which is also stored in the cache (``DJANGOCMS_LINK_CACHE``).
+Saving or deleting a link target, or publishing, unpublishing or moving a page, removes the
+generation from the cache. Workers compare it with their snapshot's generation at most every
+``DJANGOCMS_LINK_SNAPSHOT_CHECK_INTERVAL`` seconds and ignore a stale snapshot until it is
+rewritten.
+
+The snapshot is only used if ``DJANGOCMS_LINK_SNAPSHOT`` is set to the path of the file.
+
+File layout (little endian): A header (magic, format version, generation, number of entries)
+followed by the entries' (hash of the key, offset, length) sorted by hash, and the entries'
+data: key (reference and language), site id of the target and url, separated by null bytes.
+"""
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import time
+import uuid
+from collections.abc import Iterable, Iterator
+
+from django.conf import settings
+from django.db import models
+from django.utils.translation import get_language
+
+from djangocms_link import cache as link_cache
+from djangocms_link.signals import connect_model_signals, connect_page_operation_signals
+
+
+SNAPSHOT = getattr(settings, "DJANGOCMS_LINK_SNAPSHOT", None)
+CHECK_INTERVAL = getattr(settings, "DJANGOCMS_LINK_SNAPSHOT_CHECK_INTERVAL", 1)
+BATCH_SIZE = 500
+
+MAGIC = b"DJLS"
+VERSION = 1
+HEADER = struct.Struct("<4sH32sI")  # magic, version, generation, number of entries
+ENTRY = struct.Struct("<QII")  # hash of the key, offset of the data, length of the data
+GENERATION_KEY = f"{link_cache.CACHE_PREFIX}:snapshot"
+
+
+class Snapshot:
+    """Read-only view of a snapshot file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, generation, self.count = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self.mmap.close()
+            raise ValueError(f"{path} is not a link snapshot.")
+        self.generation = generation.decode()
+
+    def close(self) -> None:
+        self.mmap.close()
+
+    def get(self, reference: str, language: str) -> tuple[int | None, str | None] | None:
+        """Return the site id and url of a link target in a language, or None if it is missing."""
+        key = get_key(reference, language)
+        key_hash = get_hash(key)
+        low, high = 0, self.count
+        while low < high:  # Leftmost entry with the hash
+            middle = (low + high) // 2
+            if ENTRY.unpack_from(self.mmap, HEADER.size + middle * ENTRY.size)[0] < key_hash:
+                low = middle + 1
+            else:
+                high = middle
+        for index in range(low, self.count):
+            entry_hash, offset, length = ENTRY.unpack_from(self.mmap, HEADER.size + index * ENTRY.size)
+            if entry_hash != key_hash:
+                break
+            entry_key, site_id, url = self.mmap[offset:offset + length].split(b"\0")
+            if entry_key == key:
+                return int(site_id) if site_id else None, url[1:].decode() if url else None
+        return None
+
+
+_snapshot: Snapshot | None = None
+_valid = False
+_checked = 0.0
+
+
+def get_key(reference: str, language: str) -> bytes:
+    return f"{reference}|{language}".encode()
+
+
+def get_hash(key: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def get_snapshot() -> Snapshot | None:
+    """Return the snapshot if it is current. The generation in the cache is checked at most every
+    ``CHECK_INTERVAL`` seconds, and the file is reopened if it has been replaced."""
+    global _snapshot, _valid, _checked
+
+    if not SNAPSHOT:
+        return None
+    now = time.monotonic()
+    if now - _checked >= CHECK_INTERVAL:
+        _checked = now
+        generation = link_cache.get_cache().get(GENERATION_KEY)
+        if _snapshot is None or _snapshot.generation != generation:
+            if _snapshot is not None:
+                _snapshot.close()
+            try:
+                _snapshot = Snapshot(SNAPSHOT)
+            except (OSError, ValueError, struct.error):
+                _snapshot = None
+        _valid = _snapshot is not None and _snapshot.generation == generation
+    return _snapshot if _valid else None
+
+
+def resolve_from_snapshot(link_field_values: list[dict], site_id: int | None = None) -> list[dict]:
+    """Cache the urls of link field values found in the snapshot and return all others."""
+    snapshot = get_snapshot()
+    if snapshot is None:
+        return link_field_values
+
+    from djangocms_link.helpers import add_site_domain, get_rel_reference, set_cached_url
+
+    language, others = get_language(), []
+    for link_field_value in link_field_values:
+        reference = get_rel_reference(link_field_value)
+        found = snapshot.get(reference, language) if reference else None
+        if found is None:
+            others.append(link_field_value)
+            continue
+        url = add_site_domain(found[1], found[0], site_id)
+        set_cached_url(link_field_value, url + link_field_value.get("anchor", "") if url else url, site_id)
+    return others
+
+
+def get_entries(batch_size: int = BATCH_SIZE) -> Iterator[tuple[bytes, int | None, str | None]]:
+    """Yield (key, site id, url) of all link targets in all languages."""
+    from djangocms_link.helpers import _model_references
+    from djangocms_link.stored_urls import get_stored_urls
+
+    languages = [code for code, _name in settings.LANGUAGES]
+    for label, (model, manager) in list(_model_references.items()):
+        qs = manager.all()
+        if label == "cms.page" and hasattr(model, "urls"):
+            qs = qs.prefetch_related("urls")
+        for obj in qs.iterator(chunk_size=batch_size):
+            reference = f"{label}:{obj.pk}"
+            for language, (site_id, url) in get_stored_urls({}, languages, obj).items():
+                yield get_key(reference, language), site_id, url
+
+
+def write(path: str, entries: Iterable[tuple[bytes, int | None, str | None]]) -> tuple[str, int]:
+    """Write a snapshot file (replacing an existing one) and return its generation and number of entries."""
+    generation = uuid.uuid4().hex
+    data = [
+        b"\0".join((key, str(site_id or "").encode(), b"" if url is None else b"=" + url.encode()))
+        for key, site_id, url in entries
+    ]
+    # Entries are sorted by the hash of their key for binary search
+    index = sorted((get_hash(value.split(b"\0", 1)[0]), position) for position, value in enumerate(data))
+    offsets, offset = [], HEADER.size + len(index) * ENTRY.size
+    for value in data:
+        offsets.append(offset)
+        offset += len(value)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".link-snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, generation.encode(), len(index)))
+            for key_hash, position in index:
+                file.write(ENTRY.pack(key_hash, offsets[position], len(data[position])))
+            for value in data:
+                file.write(value)
+        os.replace(temp_path, path)  # Workers keep reading the previous file until they reopen it
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+    return generation, len(index)
+
+
+def build(path: str | None = None, batch_size: int = BATCH_SIZE) -> int:
+    """Write a snapshot of all link targets and make it current. Returns the number of entries."""
+    path = path or SNAPSHOT
+    cache = link_cache.get_cache()
+    # Changes while the snapshot is written remove the marker, leaving the new snapshot stale
+    marker = uuid.uuid4().hex
+    cache.set(GENERATION_KEY, marker, timeout=None)
+    generation, count = write(path, get_entries(batch_size))
+    if cache.get(GENERATION_KEY) == marker:
+        cache.set(GENERATION_KEY, generation, timeout=None)
+    return count
+
+
+def invalidate(*args, **kwargs) -> None:
+    """Mark the snapshot as stale in all workers."""
+    global _valid
+
+    if not SNAPSHOT:
+        return
+    link_cache.get_cache().delete(GENERATION_KEY)
+    _valid = False
+
+
+def connect_signals(target_models: Iterable[type[models.Model]]) -> None:
+    """Mark the snapshot as stale if one of the ``target_models`` is changed (only if ``SNAPSHOT`` is set)."""
+    if not SNAPSHOT:
+        return
+    connect_model_signals(invalidate, target_models, "djangocms_link_snapshot")
+    connect_page_operation_signals(invalidate, "djangocms_link_snapshot")
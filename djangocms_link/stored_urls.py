@@ -0,0 +1,167 @@
+"""
+Persisted link urls: A ``LinkURLsField`` stores the resolved url of a ``LinkField`` per
+language together with the site of the link target. ``get_link`` reads the stored value
+(adding the target site's domain if needed) without querying the link target.
+
+Stored urls are written when the model instance is saved and refreshed in batches when
+link targets are changed, deleted, published, unpublished or moved. Links to the descendants
+of a page are only refreshed if the page's path or slug changes. This is only done if
+``DJANGOCMS_LINK_STORE_URLS`` is set to ``True``.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+from django.utils.translation import override
+
+from djangocms_link import references as link_references
+from djangocms_link.helpers import LinkDict, clear_cached_url, get_obj_site_id, get_rel_objs, get_rel_reference
+from djangocms_link.signals import (
+    connect_model_signals, connect_page_operation_signals, track_url_changes, url_changed,
+)
+
+
+STORE_URLS = getattr(settings, "DJANGOCMS_LINK_STORE_URLS", False)
+BATCH_SIZE = 500
+
+# Concrete models with a LinkURLsField: (model, name of the LinkURLsField, name of the LinkField)
+_registry: list[tuple[type[models.Model], str, str]] = []
+
+
+def register(model: type[models.Model], field_name: str, link_field_name: str) -> None:
+    if (model, field_name, link_field_name) not in _registry:
+        _registry.append((model, field_name, link_field_name))
+
+
+def get_languages(instance: models.Model) -> list[str]:
+    """Plugins store urls in their language, other models in all languages."""
+    language = getattr(instance, "language", None)
+    return [language] if language else [code for code, _name in settings.LANGUAGES]
+
+
+def get_stored_urls(link_field_value: dict, languages: Iterable[str], obj: models.Model | None) -> dict:
+    """Return the urls to store for a link field value (with its target ``obj`` already fetched)."""
+    urls = {}
+    for language in languages:
+        with override(language):
+            if hasattr(obj, "get_absolute_url"):
+                url = obj.get_absolute_url()  # Can be None
+                if url:
+                    url += link_field_value.get("anchor", "")
+                urls[language] = [get_obj_site_id(obj), url]
+            elif hasattr(obj, "url"):
+                urls[language] = [None, obj.url]
+            else:
+                urls[language] = [None, None]
+    return urls
+
+
+def refresh(instances: list[models.Model], field_name: str, link_field_name: str) -> list[models.Model]:
+    """Recompute the stored urls of ``instances`` with one query per link target model."""
+    links = [getattr(instance, link_field_name) or {} for instance in instances]
+    references = [None if "external_link" in link else get_rel_reference(link) for link in links]
+    objs = get_rel_objs(reference for reference in references if reference)
+    for instance, link, reference in zip(instances, links, references):
+        urls = get_stored_urls(link, get_languages(instance), objs[reference]) if reference else {}
+        setattr(instance, field_name, urls)
+        if isinstance(link, LinkDict):
+            link.stored_urls = urls
+            clear_cached_url(link)
+    return instances
+
+
+def get_reference_filter(link_field_name: str, references: Iterable[str]) -> Q:
+    internal_links, file_links = [], []
+    for reference in references:
+        if reference.startswith("filer.file:"):
+            pk = reference.split(":", 1)[1]
+            file_links += [pk, int(pk)] if pk.isdigit() else [pk]
+        else:
+            internal_links.append(reference)
+    query = Q(pk__in=[])
+    if internal_links:
+        query |= Q(**{f"{link_field_name}__internal_link__in": internal_links})
+    if file_links:
+        query |= Q(**{f"{link_field_name}__file_link__in": file_links})
+    return query
+
+
+def refresh_references(references: Iterable[str]) -> None:
+    """Refresh the stored urls of all rows linking to one of the given references in batches."""
+    references = list(references)
+    if not references:
+        return
+    for model, field_name, link_field_name in _registry:
+        if link_references.INDEX_LINKS:
+            # Use the reverse link index instead of scanning the link fields
+            query = Q(pk__in=link_references.get_source_ids(model, link_field_name, references))
+        else:
+            query = get_reference_filter(link_field_name, references)
+        refresh_queryset(model._base_manager.filter(query), field_name, link_field_name)
+
+
+def refresh_queryset(qs: models.QuerySet, field_name: str, link_field_name: str, batch_size: int = BATCH_SIZE) -> int:
+    """Refresh the stored urls of all rows of ``qs`` in batches and return the number of rows."""
+    qs, count, last_pk = qs.order_by("pk"), 0, None
+    while True:
+        batch = qs.filter(pk__gt=last_pk) if last_pk is not None else qs
+        batch = list(batch[:batch_size])
+        if not batch:
+            break
+        qs.model._base_manager.bulk_update(refresh(batch, field_name, link_field_name), [field_name])
+        count += len(batch)
+        if len(batch) < batch_size:
+            break
+        last_pk = batch[-1].pk
+    return count
+
+
+def refresh_all(batch_size: int = BATCH_SIZE) -> int:
+    """Refresh the stored urls of all rows of all models with a ``LinkURLsField``, e.g., after
+    enabling the setting. Returns the number of rows."""
+    return sum(
+        refresh_queryset(model._base_manager.all(), field_name, link_field_name, batch_size)
+        for model, field_name, link_field_name in _registry
+    )
+
+
+def get_page_references(page, descendants: bool = True) -> list[str]:
+    """A page's path change affects the urls of its descendants, too."""
+    pages = [page.pk, *(page.get_descendant_pages().values_list("pk", flat=True) if descendants else [])]
+    return [f"cms.page:{pk}" for pk in pages]
+
+
+def refresh_target(sender: type[models.Model], instance: models.Model, **kwargs) -> None:
+    if not STORE_URLS:
+        return
+
+    from cms.models import Page
+
+    if isinstance(instance, Page):
+        references = get_page_references(instance, url_changed(instance, **kwargs))
+    elif getattr(instance, "page_id", None) and sender._meta.app_label == "cms":
+        # Page content, title or url records
+        page = Page._base_manager.filter(pk=instance.page_id).first() if url_changed(instance, **kwargs) else None
+        references = get_page_references(page) if page else [f"cms.page:{instance.page_id}"]
+    else:
+        references = [f"{instance._meta.label_lower}:{instance.pk}"]
+        if sender._meta.app_label == "filer":
+            references.append(f"filer.file:{instance.pk}")
+    refresh_references(references)
+
+
+def refresh_page_operation(page: models.Model | None) -> None:
+    if STORE_URLS and page is not None:
+        refresh_references(get_page_references(page))
+
+
+def connect_signals(target_models: Iterable[type[models.Model]]) -> None:
+    """Refresh stored urls if one of the ``target_models`` is changed (only if ``STORE_URLS`` is set)."""
+    if not STORE_URLS:
+        return
+    track_url_changes(target_models)
+    connect_model_signals(refresh_target, target_models, "djangocms_link_store")
+    connect_page_operation_signals(refresh_page_operation, "djangocms_link_store")
@@ -1,6 +1,7 @@
 from django import template
 from django.db import models
 
+from djangocms_link import deferred, helpers
 from djangocms_link.helpers import LinkDict, get_link, get_obj_link
 
 
@@ -27,3 +28,35 @@ def to_url(value):
 @register.filter
 def to_link(value):
     return LinkDict(value)
+
+
+def _get_values(values, field_name=None) -> list:
+    if field_name:
+        return [getattr(value, field_name, None) for value in values or []]
+    return list(values or [])
+
+
+@register.simple_tag
+def prefetch_links(values, field_name=None):
+    """Resolve all links in ``values`` (or their field ``field_name``) at once, e.g., before a loop:
+    {% prefetch_links items "link" %}"""
+    helpers.resolve_links(value for value in _get_values(values, field_name) if isinstance(value, dict))
+    return ""
+
+
+@register.simple_tag
+def resolve_links(values, field_name=None):
+    """Return the urls of all links in ``values`` (or their field ``field_name``) requiring one
+    query per link target model: {% resolve_links items "link" as urls %}"""
+    values = _get_values(values, field_name)
+    helpers.resolve_links(value for value in values if isinstance(value, dict))
+    return [to_url(value) for value in values]
+
+
+@register.simple_tag
+def deferred_link(value, site_id=None):
+    """Return the url of a link, or a token resolved by ``DeferredLinksMiddleware`` if links are
+    deferred: <a href="{% deferred_link obj.link %}">"""
+    if not isinstance(value, dict):
+        return ""
+    return deferred.defer(value, site_id) or get_link(value, site_id) or ""
@@ -1,6 +1,7 @@
 import os
 from tempfile import mkdtemp
 
+from django.apps import apps
 from django.core.files import File
 
 from filer.models.filemodels import File as FilerFile
@@ -8,6 +9,8 @@ from filer.models.foldermodels import Folder as FilerFolder
 from filer.models.imagemodels import Image as FilerImage
 from filer.utils.compatibility import PILImage, PILImageDraw
 
+from djangocms_link import admin as link_admin
+
 
 # from https://github.com/divio/django-filer/blob/develop/tests/helpers.py#L46-L52
 def create_image(mode="RGB", size=(800, 600)):
@@ -121,3 +124,9 @@ def get_filer_folder(folder_name="test_folder", parent=None):
     )
 
     return filer_object
+
+
+def get_target_models():
+    """Returns the link target models as passed to the ``connect_signals`` functions"""
+    config = apps.get_app_config("djangocms_link")
+    return dict(config.get_target_models(link_admin.REGISTERED_ADMIN))
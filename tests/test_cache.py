@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from cms.api import create_page
+from cms.signals import post_obj_operation
+
+from djangocms_link import cache as link_cache
+from djangocms_link.helpers import LinkDict, resolve_links
+from tests.utils.models import AnotherLinkableModel, ThirdPartyModel
+
+
+@patch.object(link_cache, "CACHE_DURATION", 60)
+class LinkCacheTestCase(TestCase):
+    def setUp(self):
+        with patch.object(link_cache, "CACHE_DURATION", 60):
+            link_cache.connect_signals()
+        cache.clear()
+        Site.objects.get_current()  # Warm the site cache
+        self.obj = ThirdPartyModel.objects.create(name="Object", path="/object/")
+        self.value = {"internal_link": f"utils.thirdpartymodel:{self.obj.pk}"}
+
+    def test_url_cached_across_link_dicts(self):
+        self.assertEqual(LinkDict(self.value).url, "/object/")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(LinkDict(self.value).url, "/object/")
+
+    def test_anchor_and_language_are_part_of_the_key(self):
+        self.assertEqual(LinkDict(self.value).url, "/object/")
+        self.assertEqual(LinkDict({**self.value, "anchor": "#top"}).url, "/object/#top")
+
+        with self.assertNumQueries(1), self.settings(LANGUAGE_CODE="fr"):
+            self.assertEqual(LinkDict(self.value).url, "/object/")
+
+    def test_save_and_delete_invalidate(self):
+        self.assertEqual(LinkDict(self.value).url, "/object/")
+
+        self.obj.path = "/changed/"
+        self.obj.save()
+        self.assertEqual(LinkDict(self.value).url, "/changed/")
+
+        self.obj.delete()
+        self.assertEqual(LinkDict(self.value).url, "")
+
+    def test_unregistered_models_not_cached(self):
+        other = AnotherLinkableModel.objects.create(title="Other", slug="other")
+        value = {"internal_link": f"utils.anotherlinkablemodel:{other.pk}"}
+        self.assertEqual(LinkDict(value).url, "/another/other/")
+
+        with self.assertNumQueries(1):
+            self.assertEqual(LinkDict(value).url, "/another/other/")
+
+    def test_page_operations_invalidate(self):
+        page = create_page("Page", "page.html", "en")
+        value = {"internal_link": f"cms.page:{page.pk}"}
+        url = page.get_absolute_url()
+        self.assertEqual(LinkDict(value).url, url)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(LinkDict(value).url, url)
+
+        request = RequestFactory().get("/")
+        request.user = User.objects.create_superuser("admin", "admin@example.com", "admin")
+        post_obj_operation.send(sender=self.__class__, operation="move_page", request=request, token=None, obj=page)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(LinkDict(value).url, url)
+        self.assertTrue(queries)  # Not served from cache
+
+    def test_resolve_links_uses_cache(self):
+        self.assertEqual(LinkDict(self.value).url, "/object/")
+        other = ThirdPartyModel.objects.create(name="Other", path="/other/")
+        links = [LinkDict(self.value), LinkDict({"internal_link": f"utils.thirdpartymodel:{other.pk}"})]
+
+        with self.assertNumQueries(1):
+            resolve_links(links)
+        self.assertEqual([link.url for link in links], ["/object/", "/other/"])
+
+        links = [LinkDict(self.value), LinkDict({"internal_link": f"utils.thirdpartymodel:{other.pk}"})]
+        with self.assertNumQueries(0):
+            resolve_links(links)
+
+    def test_concurrent_miss_waits_for_other_process(self):
+        versions = link_cache._get_versions([link_cache.GLOBAL, "utils.thirdpartymodel"])
+        url_key = link_cache._url_key(self.value, "utils.thirdpartymodel", versions, 1, "en")
+        cache.add(f"{url_key}:lock", 1)  # Another process is resolving the url
+
+        def set_by_other_process(seconds):
+            cache.set(url_key, ("/from-other-process/",))
+
+        with patch.object(link_cache.time, "sleep", set_by_other_process), self.assertNumQueries(0):
+            self.assertEqual(LinkDict(self.value).url, "/from-other-process/")
+
+
+class LinkCacheSignalsTestCase(TestCase):
+    def test_not_connected_if_disabled(self):
+        with patch.object(link_cache, "connect_model_signals") as connect:
+            link_cache.connect_signals()
+            connect.assert_not_called()
+
+            with patch.object(link_cache, "SEARCH_CACHE_DURATION", 60):
+                link_cache.connect_signals()
+        models = connect.call_args.args[1]
+        self.assertIn(ThirdPartyModel, models)
+        self.assertNotIn(User, models)  # Fast deletes of other models are not affected
@@ -0,0 +1,102 @@
+from unittest.mock import patch
+
+from django.http import HttpResponse, JsonResponse
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase
+from django.utils.translation import override
+
+from djangocms_link import deferred
+from djangocms_link.helpers import LinkDict, set_cached_url
+from djangocms_link.middleware import DeferredLinksMiddleware
+from tests.utils.models import ThirdPartyModel
+
+
+class DeferredLinksTestCase(TestCase):
+    def setUp(self):
+        self.objs = [ThirdPartyModel.objects.create(name=f"Object {i}", path=f"/object-{i}/") for i in range(3)]
+
+    def link(self, obj, **kwargs):
+        return LinkDict({"internal_link": f"utils.thirdpartymodel:{obj.pk}", **kwargs})
+
+    def test_token_round_trip(self):
+        for link_field_value in ({"internal_link": "cms.page:1", "anchor": "#top"}, {"file_link": 2}):
+            with self.subTest(link_field_value=link_field_value):
+                token = deferred.encode(link_field_value, 1, "en")
+                payload = deferred.TOKEN_PATTERN.fullmatch(token.encode())[1]
+                self.assertEqual(
+                    deferred.decode(payload),
+                    ({key: str(value) for key, value in link_field_value.items()}, 1, "en"),
+                )
+        self.assertIsNone(deferred.decode(b"invalid"))
+
+    def test_forged_token_not_substituted(self):
+        token = deferred.encode({"internal_link": f"utils.thirdpartymodel:{self.objs[0].pk}"}, None, "en")
+        payload = token[len("djangocms-link:"):-1].rsplit(":", 1)[0]
+        forged = f"djangocms-link:{payload}:{'A' * 43};".encode()
+        content = b"<p>You searched for: " + forged + b"</p>"
+
+        self.assertIsNone(deferred.decode(forged[len(b"djangocms-link:"):-1]))
+        self.assertEqual(deferred.substitute(content, 1), content)
+        self.assertEqual(deferred.substitute(token.encode(), 1), b"/object-0/")
+
+    def test_deferred_link_tag(self):
+        link = self.link(self.objs[0])
+        template = Template("{% load djangocms_link_tags %}{% deferred_link link %}")
+
+        with override("en"), self.assertNumQueries(0), deferred.deferred_links():
+            token = template.render(Context({"link": link}))
+            self.assertTrue(token.startswith("djangocms-link:"))
+            self.assertEqual(
+                template.render(Context({"link": LinkDict("https://example.com/")})), "https://example.com/"
+            )
+            set_cached_url(link, "/cached/")
+            self.assertEqual(template.render(Context({"link": link})), "/cached/")
+        with override("en"):
+            self.assertEqual(template.render(Context({"link": self.link(self.objs[0])})), "/object-0/")
+
+    def test_str_not_deferred(self):
+        link = self.link(self.objs[0])
+
+        with override("en"), deferred.deferred_links():
+            self.assertEqual(str(link), "/object-0/")
+
+    def test_substitute(self):
+        links = [self.link(obj) for obj in self.objs] + [self.link(self.objs[0], anchor="#top")]
+        template = Template(
+            "{% load djangocms_link_tags %}"
+            "{% for link in links %}<a href=\"{% deferred_link link %}\"></a>{% endfor %}"
+        )
+        with override("en"), deferred.deferred_links():
+            content = template.render(Context({"links": links})).encode()
+
+        with self.assertNumQueries(1):
+            content = deferred.substitute(content, 1)
+        self.assertEqual(
+            content.decode(),
+            '<a href="/object-0/"></a><a href="/object-1/"></a><a href="/object-2/"></a><a href="/object-0/#top"></a>',
+        )
+        self.assertEqual(deferred.substitute(b"djangocms-link:invalid;"), b"djangocms-link:invalid;")
+
+    def test_middleware(self):
+        link = self.link(self.objs[0])
+
+        def get_response(request):
+            with override("en"):
+                return HttpResponse(f"<a href=\"{deferred.defer(link) or link.url}\"></a>")
+
+        request = RequestFactory().get("/")
+        with patch.object(deferred, "DEFERRED_LINKS", True):
+            response = DeferredLinksMiddleware(get_response)(request)
+        self.assertEqual(response.content, b'<a href="/object-0/"></a>')
+
+        with patch.object(deferred, "DEFERRED_LINKS", False):
+            response = DeferredLinksMiddleware(get_response)(request)
+        self.assertEqual(response.content, b'<a href="/object-0/"></a>')
+
+    def test_middleware_skips_other_content(self):
+        def get_response(request):
+            return JsonResponse({"link": deferred.encode({"internal_link": "cms.page:1"}, None, "en")})
+
+        with patch.object(deferred, "DEFERRED_LINKS", True):
+            response = DeferredLinksMiddleware(get_response)(RequestFactory().get("/"))
+        self.assertIn(b"djangocms-link:", response.content)
@@ -1,13 +1,24 @@
+import json
 import re
+import threading
+from unittest import skipIf
+from unittest.mock import patch
 
+import django
 from django.contrib import admin
+from django.contrib.auth.models import AnonymousUser, User
 from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import RequestFactory, TransactionTestCase
 
 from cms.api import create_page, create_title
 from cms.models import Page
 from cms.test_utils.testcases import CMSTestCase
 from cms.utils.urlutils import admin_reverse
 
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
 from djangocms_link.admin import UNICODE_SPACE
 from djangocms_link.models import Link
 from tests.utils.models import ThirdPartyModel
@@ -341,6 +352,21 @@ class LinkEndpointThirdPartyTestCase(CMSTestCase):
         self.assertEqual(data["text"], "First")
         self.assertEqual(data["url"], self.items[0].get_absolute_url())
 
+    def test_bulk_urls(self):
+        calls = []
+
+        def get_absolute_urls(cls, objs):
+            calls.append(len(objs))
+            return [f"/bulk/{obj.pk}/" for obj in objs]
+
+        with patch.object(ThirdPartyModel, "get_absolute_urls", classmethod(get_absolute_urls), create=True):
+            with self.login_user_context(self.get_superuser()):
+                data = self.client.get(self.endpoint).json()
+
+        self.assertEqual(calls, [len(data["results"][0]["children"])])
+        for destination in data["results"][0]["children"]:
+            self.assertEqual(destination["url"], f"/bulk/{destination['id'].split(':')[1]}/")
+
     def test_pagination(self):
         from djangocms_link.admin import AdminUrlsView
 
@@ -383,14 +409,79 @@ class LinkEndpointThirdPartyTestCase(CMSTestCase):
         view.request = None
         view.paginate_by = 1
         view.kwargs = {"page": 1}
-        view.has_perm = lambda request, obj=None: True
+        view.filter_viewable = lambda request, objs: objs
+        view.set_cursor = lambda page, position: None
 
         objects = view.get_paginated_multi_qs([first_qs, second_qs])
 
-        self.assertEqual(objects, list(self.items[:2]))
+        self.assertEqual(list(objects), list(self.items[:2]))
         self.assertEqual(first_qs.iterated, 2)
         self.assertEqual(second_qs.iterated, 0)
 
+    def test_multi_queryset_pagination_cursor(self):
+        from djangocms_link import cache as link_cache
+        from djangocms_link.admin import AdminUrlsView
+
+        cache.clear()
+        more = [ThirdPartyModel.objects.create(name=f"Object {i}", path=f"/object-{i}") for i in range(3)]
+        collect_objects = patch.object(
+            AdminUrlsView, "collect_objects", autospec=True, side_effect=AdminUrlsView.collect_objects
+        )
+        with patch.object(AdminUrlsView, "paginate_by", 2), collect_objects as collect:
+            with self.login_user_context(self.get_superuser()):
+                pages = [self.client.get(self.endpoint + f"?page={page}").json() for page in (1, 2, 3, 4)]
+                # Each page continues at the position (queryset, offset) where the previous one ended
+                self.assertEqual([call.args[2:] for call in collect.call_args_list], [
+                    ((0, 0), 0, 3), ((1, 2), 0, 3), ((1, 4), 0, 3), ((1, 6), 0, 3),
+                ])
+
+            # Cursors are not shared between users, even with the same permissions
+            other = User.objects.create_superuser("other", "other@example.com", "other")
+            with self.login_user_context(other):
+                self.client.get(self.endpoint + "?page=3")
+                self.assertEqual(collect.call_count, 5)
+                self.assertEqual(collect.call_args.args[2:], ((0, 0), 4, 3))
+
+            with self.login_user_context(self.get_superuser()):
+                # Search results changed: Objects of previous pages are skipped without cursor
+                with patch.object(link_cache, "SEARCH_CACHE_DURATION", 60):
+                    link_cache.invalidate_search()
+                self.assertEqual(self.client.get(self.endpoint + "?page=3").json(), pages[2])
+                self.assertEqual(collect.call_args.args[2:], ((0, 0), 4, 3))
+
+        ids = [child["id"] for page in pages for child in page["results"][0]["children"]]
+        expected = [f"utils.thirdpartymodel:{obj.pk}" for obj in self.items + tuple(more)]
+        self.assertEqual(ids, expected)
+        self.assertEqual([page["pagination"]["more"] for page in pages], [True, True, True, False])
+
+    def test_batch_permissions(self):
+        from django.contrib.admin import ModelAdmin
+
+        from tests.utils.admin import ThirdPartyAdmin
+
+        calls = []
+
+        def filter_viewable(request, objs):
+            calls.append(len(objs))
+            return [obj for obj in objs if obj.name != "Second"]
+
+        model_admin = admin.site._registry[ThirdPartyModel]
+        with patch.object(model_admin, "filter_viewable", filter_viewable, create=True):
+            with self.login_user_context(self.get_superuser()):
+                data = self.client.get(self.endpoint).json()
+        names = [child["text"] for child in data["results"][0]["children"]]
+        self.assertEqual(names, ["First", "django CMS", "django CMS rocks"])
+        self.assertEqual(calls, [len(self.items)])  # One call for all candidates
+
+        # Without object-level permissions, each model is checked once
+        check = patch.object(
+            ModelAdmin, "has_view_permission", autospec=True, side_effect=ModelAdmin.has_view_permission
+        )
+        with check as has_view_permission, self.login_user_context(self.get_superuser()):
+            self.client.get(self.endpoint)
+        checks = [call for call in has_view_permission.call_args_list if isinstance(call.args[0], ThirdPartyAdmin)]
+        self.assertEqual(len(checks), 1)
+
     def test_invalid_page_number(self):
         with self.login_user_context(self.get_superuser()):
             response = self.client.get(self.endpoint + "?page=999")
@@ -405,6 +496,42 @@ class LinkEndpointThirdPartyTestCase(CMSTestCase):
         # Empty results as the user has no permissions
         self.assertEqual(data, {"results": [], "pagination": {"more": False}})
 
+    def test_search_cache(self):
+        from djangocms_link import cache as link_cache
+        from djangocms_link.admin import AdminUrlsView
+
+        cache.clear()
+        with patch.object(link_cache, "SEARCH_CACHE_DURATION", 60):
+            link_cache.connect_signals()
+            with self.login_user_context(self.get_superuser()):
+                data = self.client.get(self.endpoint + "?term=CMS").json()
+                with patch.object(AdminUrlsView, "get_queryset", side_effect=AssertionError):
+                    self.assertEqual(self.client.get(self.endpoint + "?term=CMS").json(), data)
+
+                ThirdPartyModel.objects.create(name="django CMS 3", path="/django-cms-3")
+                self.assertEqual(len(self.client.get(self.endpoint + "?term=CMS").json()["results"][0]["children"]), 3)
+
+            # Users with other permissions do not share results
+            with self.login_user_context(self.get_staff_user_with_no_permissions()):
+                self.assertEqual(self.client.get(self.endpoint + "?term=CMS").json()["results"], [])
+
+    def test_search_cache_per_user(self):
+        # Users with the same permissions can still see different pages (page permissions)
+        from djangocms_link import cache as link_cache
+        from djangocms_link.admin import AdminUrlsView
+
+        users = [User.objects.create_user(f"editor{i}", is_staff=True) for i in range(2)]
+        keys = set()
+        with patch.object(link_cache, "SEARCH_CACHE_DURATION", 60):
+            for user in users:
+                request = RequestFactory().get(self.endpoint + "?term=CMS")
+                request.user = user
+                view = AdminUrlsView(admin_site=admin.site)
+                view.setup(request)
+                view.term, view.language, view.site = view.process_request(request)
+                keys.add(view.get_cache_key(request))
+        self.assertEqual(len(keys), 2)
+
 
 class LinkEndpointMultiModelTestCase(CMSTestCase):
     def setUp(self):
@@ -437,3 +564,118 @@ class LinkEndpointMultiModelTestCase(CMSTestCase):
         self.assertEqual(len(data["results"]), 2)
         self.assertEqual(data["results"][0]["text"], "Pages")
         self.assertEqual(data["results"][1]["text"], "Third party models")
+
+
+class LinkEndpointSearchThreadsTestCase(TransactionTestCase):
+    def setUp(self):
+        self.items = [ThirdPartyModel.objects.create(name=f"Object {i}", path=f"/object-{i}") for i in range(5)]
+
+    def test_querysets_fetched_concurrently(self):
+        from djangocms_link import admin as link_admin
+
+        view = link_admin.AdminUrlsView()
+        view.request = None
+        view.filter_viewable = lambda request, objs: objs
+        qs_list = [
+            ThirdPartyModel.objects.filter(pk__in=[obj.pk for obj in self.items[:2]]).order_by("pk"),
+            ThirdPartyModel.objects.none(),
+            ThirdPartyModel.objects.order_by("-pk"),
+        ]
+        threads = []
+
+        def fetch_in_thread(qs):
+            threads.append(threading.current_thread().name)
+            return fetch(qs)
+
+        fetch = link_admin.fetch_in_thread
+        with patch.object(link_admin, "SEARCH_THREADS", 2):
+            with patch.object(link_admin, "fetch_in_thread", fetch_in_thread):
+                objects, positions = view.collect_objects(qs_list, (0, 1), 0, 3)
+
+        self.assertEqual(objects, [self.items[1], self.items[4], self.items[3]])
+        self.assertEqual(positions, [(0, 1), (2, 0), (2, 1)])
+        self.assertEqual(len(threads), 3)
+        self.assertTrue(all(name.startswith("djangocms_link") for name in threads))
+
+        # Objects to skip are not fetched from all querysets
+        threads.clear()
+        with patch.object(link_admin, "SEARCH_THREADS", 2):
+            with patch.object(link_admin, "fetch_in_thread", fetch_in_thread):
+                objects, positions = view.collect_objects(qs_list, (0, 0), 3, 1)
+
+        self.assertEqual(objects, [self.items[3]])
+        self.assertEqual(threads, [])
+
+
+@skipIf(django.VERSION < (5, 0), "Async admin views require Django 5.0+")
+class LinkEndpointAsyncTestCase(TransactionTestCase):
+    def setUp(self):
+        self.page = create_page("Async page", "page.html", "en")
+        self.items = [ThirdPartyModel.objects.create(name=f"Object {i}", path=f"/object-{i}") for i in range(4)]
+        self.user = User.objects.create_superuser("admin", "admin@example.com", "admin")
+        self.link_admin = admin.site._registry[Link]
+        self.addCleanup(cache.clear)
+
+    def get_request(self, query_params=""):
+        request = RequestFactory().get("/admin/djangocms_link/link/urls" + query_params)
+        request.user = self.user
+        request.session = {}
+        return request
+
+    def test_same_results_as_sync_view(self):
+        from djangocms_link import admin as link_admin
+
+        with patch.object(link_admin.AdminUrlsView, "paginate_by", 3):
+            for query_params in ("", "?page=2", "?term=object", "?term=object&page=2", "?language=fr"):
+                with self.subTest(query_params=query_params):
+                    cache.clear()  # No cursors
+                    sync_response = self.link_admin.url_view(self.get_request(query_params))
+                    cache.clear()
+                    async_response = async_to_sync(self.link_admin.async_url_view)(self.get_request(query_params))
+
+                    self.assertEqual(async_response.status_code, 200)
+                    self.assertEqual(async_response.content, sync_response.content)
+
+    def test_querysets_fetched_concurrently(self):
+        from djangocms_link import admin as link_admin
+
+        # Both fetches (pages and third party models) need to wait for each other
+        barrier = threading.Barrier(2, timeout=5)
+        fetch = link_admin.fetch_in_thread
+
+        def fetch_in_thread(qs):
+            barrier.wait()
+            return fetch(qs)
+
+        with patch.object(link_admin, "fetch_in_thread", fetch_in_thread):
+            response = async_to_sync(self.link_admin.async_url_view)(self.get_request())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)["results"]), 2)
+
+    def test_get_urls(self):
+        from djangocms_link import admin as link_admin
+
+        with patch.object(link_admin, "ASYNC_VIEW", True):
+            self.assertTrue(iscoroutinefunction(self.link_admin.get_urls()[0].callback))
+            with patch.object(django, "VERSION", (4, 2, 0, "final", 0)):
+                with self.assertRaises(ImproperlyConfigured):
+                    self.link_admin.get_urls()
+
+    def test_get_reference(self):
+        response = async_to_sync(self.link_admin.async_url_view)(
+            self.get_request(f"?g=utils.thirdpartymodel:{self.items[0].pk}")
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)["text"], "Object 0")
+
+    def test_admin_view_requires_login(self):
+        view = self.link_admin.async_admin_view(self.link_admin.async_url_view)
+        request = self.get_request()
+        request.user = AnonymousUser()
+
+        response = async_to_sync(view)(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertIn("login", response.url)
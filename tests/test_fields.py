@@ -1,10 +1,15 @@
+from unittest.mock import patch
+
 from django import forms
 from django.test import TestCase
 
 from cms.api import create_page
 
+from djangocms_link import fields
 from djangocms_link.fields import LinkFormField, LinkWidget
+from djangocms_link.helpers import LinkDict
 from tests.helpers import get_filer_file
+from tests.utils.models import LinkedModel
 
 
 class LinkFieldTestCase(TestCase):
@@ -168,3 +173,40 @@ class LinkFieldTestCase(TestCase):
         )
         # Site selector uses django admin autocomplete
         self.assertIn('data-ajax--url="/en/admin/autocomplete/"', rendered_widget)
+
+    def test_from_db_value(self):
+        LinkedModel.objects.create(
+            link={"internal_link": f"cms.page:{self.page.pk}", "anchor": "#top"},
+            secondary_link={"file_link": self.file.pk},
+        )
+        obj = LinkedModel.objects.get()
+
+        self.assertIsInstance(obj.link, LinkDict)
+        self.assertEqual(obj.link, {"internal_link": f"cms.page:{self.page.pk}", "anchor": "#top"})
+        self.assertEqual(obj.link.url, self.page.get_absolute_url() + "#top")
+        self.assertEqual(obj.secondary_link.type, "file_link")
+        self.assertEqual(
+            list(LinkedModel.objects.values_list("link", flat=True)),
+            [{"internal_link": f"cms.page:{self.page.pk}", "anchor": "#top"}],
+        )
+
+    def test_json_codec(self):
+        import orjson
+
+        self.assertIsNone(fields.get_json_codec(None))
+        self.assertIsNone(fields.get_json_codec("not_installed_json_codec"))
+        self.assertIs(fields.get_json_codec("orjson"), orjson)
+
+        with patch.object(fields, "JSON_CODEC", orjson):
+            link = LinkDict({"internal_link": f"cms.page:{self.page.pk}", "anchor": "#top"})
+            link.url  # Fill cache
+            obj = LinkedModel.objects.create(link=link, secondary_link={"external_link": "tel:+1 234"})
+            obj = LinkedModel.objects.get(pk=obj.pk)
+
+            self.assertIsInstance(obj.link, LinkDict)
+            self.assertEqual(obj.link, {"internal_link": f"cms.page:{self.page.pk}", "anchor": "#top"})
+            self.assertEqual(obj.secondary_link.url, "tel:+1234")
+            self.assertTrue(LinkedModel.objects.filter(link__anchor="#top").exists())
+
+        # Rows written with the codec can be read without it
+        self.assertEqual(LinkedModel.objects.get(pk=obj.pk).link, obj.link)
@@ -1,8 +1,16 @@
-from django.test import TestCase
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
 from django.utils.crypto import get_random_string
 
-from djangocms_link.helpers import get_rel_obj
-from tests.utils.models import ThirdPartyModel
+from djangocms_link.helpers import (
+    LinkDict, _model_references, clear_site_domains, get_current_site_id, get_model_reference, get_obj_link,
+    get_obj_links, get_rel_obj, get_site_domains, identity_map, resolve_links,
+)
+from djangocms_link.middleware import LinkIdentityMapMiddleware
+from tests.helpers import get_filer_file
+from tests.utils.models import AnotherLinkableModel, ThirdPartyModel
 
 
 class GetRelObjTestCase(TestCase):
@@ -57,3 +65,181 @@ class GetRelObjTestCase(TestCase):
         result = get_rel_obj(internal_link)
 
         self.assertIsNone(result)
+
+
+class ModelReferenceTestCase(TestCase):
+    def test_registry_built_on_ready(self):
+        from cms.models import Page
+
+        self.assertIn("cms.page", _model_references)
+        self.assertIn("utils.thirdpartymodel", _model_references)
+        self.assertIs(get_model_reference("cms.page")[0], Page)
+
+    def test_get_model_reference_cached(self):
+        obj = ThirdPartyModel.objects.create(name="Object", path="/object/")
+        get_model_reference("utils.anotherlinkablemodel")
+
+        with patch("djangocms_link.helpers.apps.get_model") as get_model:
+            self.assertEqual(get_rel_obj(f"utils.thirdpartymodel:{obj.pk}"), obj)
+            self.assertIs(get_model_reference("utils.anotherlinkablemodel")[0], AnotherLinkableModel)
+        get_model.assert_not_called()
+
+        with self.assertRaises(LookupError):
+            get_model_reference("utils.nomodel")
+
+
+class ResolveLinksTestCase(TestCase):
+    def test_one_query_per_model(self):
+        """Test that resolve_links needs one query per target model"""
+        objs = [
+            ThirdPartyModel.objects.create(name=get_random_string(5), path=f"/{get_random_string(5)}/")
+            for _ in range(5)
+        ]
+        other = AnotherLinkableModel.objects.create(title="Other", slug="other")
+        links = [LinkDict(
+            {"internal_link": f"{obj._meta.app_label}.{obj._meta.model_name}:{obj.pk}"}
+        ) for obj in objs]
+        links.append(LinkDict({"internal_link": f"utils.anotherlinkablemodel:{other.pk}"}))
+        Site.objects.get_current()  # Warm the site cache
+
+        with self.assertNumQueries(2):
+            resolve_links(links)
+
+        with self.assertNumQueries(0):
+            for link, obj in zip(links, objs):
+                self.assertEqual(link.url, obj.get_absolute_url())
+            self.assertEqual(links[-1].url, "/another/other/")
+
+    def test_same_result_as_get_link(self):
+        """Test that resolve_links resolves the same urls as get_link"""
+        site = Site.objects.create(domain="other.example.com", name="Other site")
+        file = get_filer_file()
+        local = ThirdPartyModel.objects.create(name="local", path="/local/")
+        remote = ThirdPartyModel.objects.create(name="remote", path="/remote/", site=site)
+        empty = ThirdPartyModel.objects.create(name="empty", path="")
+        values = [
+            {"internal_link": f"utils.thirdpartymodel:{local.pk}", "anchor": "#top"},
+            {"internal_link": f"utils.thirdpartymodel:{remote.pk}"},
+            {"internal_link": f"utils.thirdpartymodel:{empty.pk}", "anchor": "#top"},
+            {"internal_link": "utils.thirdpartymodel:999999"},
+            {"internal_link": "utils.thirdpartymodel:invalid"},
+            {"internal_link": "nonexistentapp.model:1"},
+            {"file_link": file.pk},
+            {"external_link": "tel:+1 234 567"},
+            {"external_link": "https://www.example.com"},
+            {},
+        ]
+        expected = [LinkDict(value).url for value in values]
+        links = [LinkDict(value) for value in values]
+
+        resolve_links(links)
+
+        self.assertEqual([link.url for link in links], expected)
+        self.assertEqual(expected[0], "/local/#top")
+        self.assertEqual(expected[1], "//other.example.com/remote/")
+        self.assertEqual(expected[7], "tel:+1234567")
+        file.delete()
+
+
+class BulkUrlsTestCase(TestCase):
+    def test_get_absolute_urls_protocol(self):
+        objs = [ThirdPartyModel.objects.create(name=f"Obj {i}", path=f"/obj-{i}/") for i in range(3)]
+        other = AnotherLinkableModel.objects.create(title="Other", slug="other")
+        calls = []
+
+        def get_absolute_urls(cls, objs):
+            calls.append(len(objs))
+            return [f"/bulk{obj.path}" for obj in objs]
+
+        links = [LinkDict({"internal_link": f"utils.thirdpartymodel:{obj.pk}", "anchor": "#a"}) for obj in objs]
+        links += [
+            LinkDict({"internal_link": f"utils.thirdpartymodel:{objs[0].pk}"}),
+            LinkDict({"internal_link": f"utils.anotherlinkablemodel:{other.pk}"}),
+        ]
+        with patch.object(ThirdPartyModel, "get_absolute_urls", classmethod(get_absolute_urls), create=True), \
+                patch.object(ThirdPartyModel, "get_absolute_url") as get_absolute_url:
+            resolve_links(links, 1)
+            self.assertEqual(get_obj_links(objs[:1] + [other], 1), ["/bulk/obj-0/", "/another/other/"])
+
+        self.assertEqual(calls, [3, 1])
+        get_absolute_url.assert_not_called()
+        self.assertEqual(
+            [link.url for link in links],
+            ["/bulk/obj-0/#a", "/bulk/obj-1/#a", "/bulk/obj-2/#a", "/bulk/obj-0/", "/another/other/"],
+        )
+
+
+class SiteDomainsTestCase(TestCase):
+    def test_site_domains_loaded_once(self):
+        site = Site.objects.create(domain="other.example.com", name="Other site")
+        obj = ThirdPartyModel.objects.create(name="remote", path="/remote/", site=site)
+        get_site_domains()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_obj_link(obj, 1), "//other.example.com/remote/")
+            self.assertEqual(get_site_domains()[site.pk], "other.example.com")
+
+    def test_site_domains_invalidated(self):
+        site = Site.objects.create(domain="other.example.com", name="Other site")
+        self.assertEqual(get_site_domains()[site.pk], "other.example.com")
+
+        site.domain = "changed.example.com"
+        site.save()
+        self.assertEqual(get_site_domains()[site.pk], "changed.example.com")
+
+        site.delete()
+        self.assertNotIn(site.pk, get_site_domains())
+
+    def test_current_site_id_from_request(self):
+        site = Site.objects.create(domain="other.example.com", name="Other site")
+        request = RequestFactory().get("/", HTTP_HOST="other.example.com:8000")
+        get_site_domains()
+
+        with self.settings(SITE_ID=None, ALLOWED_HOSTS=["*"]), self.assertNumQueries(0):
+            self.assertEqual(get_current_site_id(request), site.pk)
+        self.assertEqual(get_current_site_id(request), 1)
+
+
+class IdentityMapTestCase(TestCase):
+    def setUp(self):
+        self.obj = ThirdPartyModel.objects.create(name="Object", path="/object/")
+        self.reference = f"utils.thirdpartymodel:{self.obj.pk}"
+
+    def test_objects_fetched_once(self):
+        with identity_map():
+            with self.assertNumQueries(1):
+                self.assertEqual(get_rel_obj(self.reference), self.obj)
+                self.assertIs(get_rel_obj(self.reference), get_rel_obj(self.reference))
+                links = [LinkDict({"internal_link": self.reference}) for _ in range(3)]
+                self.assertEqual([link.url for link in links], ["/object/"] * 3)
+                resolve_links([LinkDict({"internal_link": self.reference})])
+            other = ThirdPartyModel.objects.create(name="Other", path="/other/")
+            with self.assertNumQueries(1):  # Only the missing object
+                resolve_links([LinkDict({"internal_link": f"utils.thirdpartymodel:{other.pk}"})])
+                self.assertEqual(get_rel_obj(f"utils.thirdpartymodel:{other.pk}"), other)
+
+        with self.assertNumQueries(1):
+            get_rel_obj(self.reference)
+
+    def test_obj_link_and_site_cached(self):
+        site = Site.objects.create(domain="other.example.com", name="Other site")
+        request = RequestFactory().get("/", HTTP_HOST="other.example.com")
+
+        with identity_map(), self.settings(SITE_ID=None, ALLOWED_HOSTS=["*"]):
+            with patch.object(self.obj, "get_absolute_url", return_value="/object/") as get_absolute_url:
+                self.assertEqual(get_obj_link(self.obj, site.pk), "/object/")
+                self.assertEqual(get_obj_link(self.obj, site.pk), "/object/")
+            get_absolute_url.assert_called_once()
+
+            self.assertEqual(get_current_site_id(request), site.pk)
+            clear_site_domains()
+            with self.assertNumQueries(0):
+                self.assertEqual(get_current_site_id(request), site.pk)
+
+    def test_middleware(self):
+        def get_response(request):
+            get_rel_obj(self.reference)
+            get_rel_obj(self.reference)
+
+        with self.assertNumQueries(1):
+            LinkIdentityMapMiddleware(get_response)(RequestFactory().get("/"))
@@ -1,10 +1,13 @@
+import copy
+import pickle
+
 from django.template import Context, Template
 from django.test import TestCase, override_settings
 from django.utils.crypto import get_random_string
 
 from filer.models import File
 
-from djangocms_link.helpers import LinkDict
+from djangocms_link.helpers import LinkDict, get_link
 from djangocms_link.models import Link
 from tests.utils.models import ThirdPartyModel
 
@@ -144,3 +147,81 @@ class LinkDictTestCase(TestCase):
 
         rendered = template.render(Context({"page": LinkDict("tel:+1234567890")}))
         self.assertEqual(rendered, "tel:+1234567890")
+
+    def test_url_cached_per_language_and_site(self):
+        from django.contrib.sites.models import Site
+        from django.utils.translation import override
+
+        from cms.api import create_page, create_title
+
+        other_site = Site.objects.create(domain="other.example.com", name="Other site")
+        page = create_page(title="Page", template="page.html", slug="page", language="en")
+        create_title("fr", "Page", page, slug="page-fr")
+        link = LinkDict({"internal_link": f"cms.page:{page.pk}"})
+        with override("en"):
+            url_en = page.get_absolute_url()
+            self.assertEqual(link.url, url_en)
+            self.assertEqual(get_link(link, other_site.pk), f"//example.com{url_en}")
+        with override("fr"):
+            url_fr = page.get_absolute_url()
+            self.assertEqual(link.url, url_fr)
+        self.assertNotEqual(url_en, url_fr)
+
+        with self.assertNumQueries(0):
+            with override("en"):
+                self.assertEqual(link.url, url_en)
+                self.assertEqual(get_link(link, other_site.pk), f"//example.com{url_en}")
+            with override("fr"):
+                self.assertEqual(link.url, url_fr)
+
+    def test_batch_template_tags(self):
+        objs = [
+            ThirdPartyModel.objects.create(name=get_random_string(5), path=f"/{get_random_string(5)}/")
+            for _ in range(3)
+        ]
+        for obj in objs:
+            Link.objects.create(link={"internal_link": f"utils.thirdpartymodel:{obj.pk}"})
+        Link.objects.create(link={"external_link": "tel:+1 234"})
+        expected = [obj.get_absolute_url() for obj in objs] + ["tel:+1234"]
+
+        template = Template(
+            "{% load djangocms_link_tags %}{% resolve_links items 'link' as urls %}"
+            "{% for url in urls %}{{ url }},{% endfor %}"
+        )
+        items = list(Link.objects.order_by("pk"))
+        with self.assertNumQueries(1):
+            rendered = template.render(Context({"items": items}))
+        self.assertEqual(rendered, ",".join(expected) + ",")
+
+        template = Template(
+            "{% load djangocms_link_tags %}{% prefetch_links links %}"
+            "{% for link in links %}{{ link }},{% endfor %}"
+        )
+        links = [item.link for item in Link.objects.order_by("pk")]
+        with self.assertNumQueries(1):
+            rendered = template.render(Context({"links": links}))
+        self.assertEqual(rendered, ",".join(expected) + ",")
+
+        template = Template("{% load djangocms_link_tags %}{% resolve_links objs as urls %}{{ urls|join:',' }}")
+        with self.assertNumQueries(0):
+            rendered = template.render(Context({"objs": objs}))
+        self.assertEqual(rendered, ",".join(expected[:3]))
+
+    def test_phone_numbers_normalized_on_write(self):
+        link = Link.objects.create(link={"external_link": "tel:+1 234 567"})
+
+        self.assertEqual(Link.objects.get(pk=link.pk).link, {"external_link": "tel:+1234567"})
+        self.assertEqual(link.link, {"external_link": "tel:+1 234 567"})  # Original value unchanged
+
+    def test_link_dict_slots(self):
+        obj = ThirdPartyModel.objects.create(name=get_random_string(5), path="/path/")
+        link = LinkDict({"internal_link": f"utils.thirdpartymodel:{obj.pk}"})
+        self.assertFalse(hasattr(link, "__dict__"))
+        self.assertIsNone(link.url_cache)
+
+        self.assertEqual(link.url, "/path/")
+        for clone in (LinkDict(link), copy.deepcopy(link), pickle.loads(pickle.dumps(link))):
+            self.assertEqual(clone, link)
+            self.assertEqual(clone.url_cache, link.url_cache)
+            with self.assertNumQueries(0):
+                self.assertEqual(clone.url, "/path/")
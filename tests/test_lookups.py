@@ -0,0 +1,129 @@
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from cms.api import create_page
+
+from djangocms_link.lookups import LinkKey, link_index
+from tests.helpers import get_filer_file
+from tests.utils.models import LinkedModel, ThirdPartyModel
+
+
+class LinkLookupsTestCase(TestCase):
+    def setUp(self):
+        self.page = create_page("Page", "page.html", "en")
+        self.file = get_filer_file()
+        self.obj = ThirdPartyModel.objects.create(name="Object", path="/object/")
+        self.rows = {
+            "page": LinkedModel.objects.create(link={"internal_link": f"cms.page:{self.page.pk}", "anchor": "#a"}),
+            "obj": LinkedModel.objects.create(link={"internal_link": f"utils.thirdpartymodel:{self.obj.pk}"}),
+            "file": LinkedModel.objects.create(link={"file_link": self.file.pk}),
+            "file_str": LinkedModel.objects.create(link={"file_link": str(self.file.pk)}),
+            "external": LinkedModel.objects.create(link={"external_link": "https://example.com"}),
+            "tel": LinkedModel.objects.create(link={"external_link": "tel:+1234"}),
+            "mailto": LinkedModel.objects.create(link={"external_link": "mailto:info@example.com"}),
+            "anchor": LinkedModel.objects.create(link={"external_link": "#top"}),
+            "empty": LinkedModel.objects.create(link={}),
+        }
+
+    def assertRows(self, qs, *names):
+        self.assertEqual(set(qs), {self.rows[name] for name in names})
+
+    def test_points_to(self):
+        self.assertRows(LinkedModel.objects.filter(link__points_to=self.page), "page")
+        self.assertRows(LinkedModel.objects.filter(link__points_to=f"utils.thirdpartymodel:{self.obj.pk}"), "obj")
+        self.assertRows(LinkedModel.objects.filter(link__points_to=self.file), "file", "file_str")
+        self.assertRows(LinkedModel.objects.filter(link__points_to=f"filer.file:{self.file.pk}"), "file", "file_str")
+        self.assertRows(
+            LinkedModel.objects.exclude(link__points_to=self.page),
+            "obj", "file", "file_str", "external", "tel", "mailto", "anchor", "empty",
+        )
+        self.assertRows(
+            LinkedModel.objects.exclude(link__points_to=self.file),
+            "page", "obj", "external", "tel", "mailto", "anchor", "empty",
+        )
+
+    def test_target_model(self):
+        self.assertRows(LinkedModel.objects.filter(link__target_model="cms.page"), "page")
+        self.assertRows(LinkedModel.objects.filter(link__target_model=ThirdPartyModel), "obj")
+        self.assertRows(LinkedModel.objects.filter(link__target_model="filer.file"), "file", "file_str")
+        self.assertRows(LinkedModel.objects.filter(link__target_model="cms.pag"))
+        self.assertRows(
+            LinkedModel.objects.exclude(link__target_model="cms.page"),
+            "obj", "file", "file_str", "external", "tel", "mailto", "anchor", "empty",
+        )
+        self.assertRows(
+            LinkedModel.objects.exclude(link__target_model="filer.file"),
+            "page", "obj", "external", "tel", "mailto", "anchor", "empty",
+        )
+
+    def test_type(self):
+        self.assertRows(LinkedModel.objects.filter(link__type="internal_link"), "page", "obj")
+        self.assertRows(LinkedModel.objects.filter(link__type="file_link"), "file", "file_str")
+        self.assertRows(LinkedModel.objects.filter(link__type="external_link"), "external")
+        self.assertRows(LinkedModel.objects.filter(link__type="tel"), "tel")
+        self.assertRows(LinkedModel.objects.filter(link__type="mailto"), "mailto")
+        self.assertRows(LinkedModel.objects.filter(link__type="anchor"), "anchor")
+        self.assertRows(
+            LinkedModel.objects.exclude(link__type="tel"),
+            "page", "obj", "file", "file_str", "external", "mailto", "anchor", "empty",
+        )
+        self.assertRows(
+            LinkedModel.objects.exclude(link__type="external_link"),
+            "page", "obj", "file", "file_str", "tel", "mailto", "anchor", "empty",
+        )
+        with self.assertRaises(ValueError):
+            list(LinkedModel.objects.filter(link__type="unknown"))
+
+    def test_exclude(self):
+        LinkedModel.objects.exclude(pk__in=[self.rows[name].pk for name in ("page", "external", "tel")]).delete()
+
+        self.assertEqual(LinkedModel.objects.exclude(link__points_to=self.page).count(), 2)
+        self.assertEqual(LinkedModel.objects.exclude(link__target_model="cms.page").count(), 2)
+        self.assertEqual(LinkedModel.objects.exclude(link__type="tel").count(), 2)
+
+    def test_link_key(self):
+        self.assertEqual(
+            list(LinkedModel.objects.filter(link__type="internal_link").annotate(
+                target=LinkKey("internal_link", "link")
+            ).order_by("target").values_list("target", flat=True)),
+            sorted([f"cms.page:{self.page.pk}", f"utils.thirdpartymodel:{self.obj.pk}"]),
+        )
+        with self.assertRaises(ValueError):
+            LinkKey("unknown", "link")
+
+
+class LinkIndexTestCase(SimpleTestCase):
+    databases = {"default"}
+
+    def test_link_index_matches_lookup(self):
+        index = link_index("link", "internal_link", name="utils_link_target_idx")
+        with connection.schema_editor() as editor:
+            index_sql = str(index.create_sql(LinkedModel, editor))
+        lookup_sql = str(LinkedModel.objects.filter(link__points_to="cms.page:1").query)
+
+        expression = "CAST(JSON_EXTRACT({}, '$.internal_link') AS TEXT)"
+        self.assertIn(expression.format('"link"'), index_sql)
+        self.assertIn(expression.format('"utils_linkedmodel"."link"'), lookup_sql)
+
+    def test_prefix_lookups_use_index(self):
+        if connection.vendor != "sqlite":  # pragma: no cover
+            self.skipTest("Query plan checked on SQLite")
+        indexes = [
+            link_index("link", "internal_link", name="utils_link_target_idx"),
+            link_index("link", "external_link", name="utils_link_external_idx"),
+        ]
+        with connection.schema_editor() as editor:
+            for index in indexes:
+                editor.add_index(LinkedModel, index)
+        try:
+            for lookup, index in (
+                ({"link__target_model": "cms.page"}, "utils_link_target_idx"),
+                ({"link__type": "internal_link"}, "utils_link_target_idx"),
+                ({"link__type": "tel"}, "utils_link_external_idx"),
+            ):
+                with self.subTest(lookup=lookup):
+                    self.assertIn(index, LinkedModel.objects.filter(**lookup).explain())
+        finally:
+            with connection.schema_editor() as editor:
+                for index in indexes:
+                    editor.remove_index(LinkedModel, index)
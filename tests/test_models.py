@@ -1,9 +1,11 @@
+from unittest.mock import patch
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from cms.api import create_page
 
-from djangocms_link.models import TARGET_CHOICES, Link
+from djangocms_link.models import TARGET_CHOICES, Link, set_link_blank
 
 from .helpers import get_filer_file
 
@@ -148,6 +150,15 @@ class LinkModelTestCase(TestCase):
         instance.link_is_optional = True
         instance.clean()
 
+    def test_link_blank_set_at_class_creation(self):
+        field = Link._meta.get_field("link")
+        self.assertFalse(field.blank)
+        with patch.object(Link, "link_is_optional", True):
+            set_link_blank(Link)
+            self.assertTrue(field.blank)
+        set_link_blank(Link)
+        self.assertFalse(field.blank)
+
     def test_target_maps_to_link_target(self):
         instance = self.internal_link
 
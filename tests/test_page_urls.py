@@ -0,0 +1,109 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib import admin
+from django.core.management import call_command
+from django.utils.translation import override
+
+from cms.api import create_page
+from cms.models import Page
+from cms.test_utils.testcases import CMSTestCase
+from cms.utils.urlutils import admin_reverse
+
+from djangocms_link import page_urls
+from djangocms_link.helpers import get_link, resolve_links
+from djangocms_link.models import Link, MaterializedPageURL
+
+
+class PageUrlsTestCase(CMSTestCase):
+    def setUp(self):
+        patcher = patch.object(page_urls, "PAGE_URLS", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        page_urls.connect_signals()
+        self.parent = create_page("parent", "page.html", "en")
+        self.child = create_page("child", "page.html", "en", parent=self.parent)
+        self.other = create_page("other", "page.html", "en")
+
+    def get_urls(self, page):
+        return dict(MaterializedPageURL.objects.filter(page=page).values_list("language", "url"))
+
+    def test_rows_written_on_create(self):
+        self.assertEqual(self.get_urls(self.parent), {"en": "/en/parent/", "fr": "/fr/parent/"})
+        self.assertEqual(self.get_urls(self.child), {"en": "/en/parent/child/", "fr": "/fr/parent/child/"})
+
+    def test_subtree_rewritten_on_move(self):
+        endpoint = admin_reverse("cms_page_move_page", args=(self.parent.pk,))
+
+        with self.login_user_context(self.get_superuser()):
+            response = self.client.post(endpoint, {"target": self.other.pk, "position": 0})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.get_urls(self.parent)["en"], "/en/other/parent/")
+        self.assertEqual(self.get_urls(self.child)["en"], "/en/other/parent/child/")
+        self.assertEqual(self.get_urls(self.other)["en"], "/en/other/")
+
+    def test_subtree_rewritten_on_path_change(self):
+        MaterializedPageURL.objects.filter(page=self.child).update(url="/stale/")
+
+        Page.objects.get(pk=self.parent.pk).save()
+        page_url = self.parent.urls.get(language="en")
+        page_url.save()
+        self.assertEqual(self.get_urls(self.child)["en"], "/stale/")
+
+        page_url.slug = page_url.path = "new-parent"
+        page_url.save()
+        self.assertEqual(self.get_urls(self.parent)["en"], "/en/new-parent/")
+        self.assertEqual(self.get_urls(self.child)["en"], "/en/parent/child/")
+
+    def test_rows_deleted_with_page(self):
+        self.parent.delete()
+
+        self.assertFalse(MaterializedPageURL.objects.filter(page_id__in=[self.parent.pk, self.child.pk]).exists())
+        self.assertTrue(MaterializedPageURL.objects.filter(page=self.other).exists())
+
+    def test_links_resolved_from_table(self):
+        MaterializedPageURL.objects.filter(page=self.child, language="en").update(url="/en/materialized/")
+        links = [
+            {"internal_link": f"cms.page:{self.child.pk}", "anchor": "#top"},
+            {"internal_link": f"cms.page:{self.child.pk}"},
+        ]
+
+        with override("en"), self.assertNumQueries(1):
+            resolve_links(links)
+            self.assertEqual(get_link(links[0]), "/en/materialized/#top")
+            self.assertEqual(get_link(links[1]), "/en/materialized/")
+
+    def test_missing_rows_resolved_from_page(self):
+        MaterializedPageURL.objects.filter(page=self.child).delete()
+
+        with override("en"):
+            self.assertEqual(get_link({"internal_link": f"cms.page:{self.child.pk}"}), "/en/parent/child/")
+
+    def test_not_used_if_disabled(self):
+        MaterializedPageURL.objects.filter(page=self.child, language="en").update(url="/en/materialized/")
+
+        with patch.object(page_urls, "PAGE_URLS", False), override("en"):
+            self.assertEqual(get_link({"internal_link": f"cms.page:{self.child.pk}"}), "/en/parent/child/")
+
+    def test_rebuild_command(self):
+        MaterializedPageURL.objects.all().delete()
+        out = StringIO()
+
+        call_command("rebuild_page_urls", batch_size=2, stdout=out)
+
+        self.assertIn("Stored 6 page urls.", out.getvalue())
+        self.assertEqual(self.get_urls(self.child), {"en": "/en/parent/child/", "fr": "/fr/parent/child/"})
+
+    def test_endpoint_reads_table(self):
+        from djangocms_link import admin as link_admin
+
+        MaterializedPageURL.objects.filter(page=self.child, language="en").update(url="/en/materialized/")
+        endpoint = admin_reverse(admin.site._registry[Link].global_link_url_name)
+
+        with patch.object(link_admin, "REGISTERED_ADMIN", []), self.login_user_context(self.get_superuser()):
+            data = self.client.get(endpoint).json()
+
+        urls = {page["id"]: page["url"] for page in data["results"][0]["children"]}
+        self.assertEqual(urls[f"cms.page:{self.child.pk}"], "/en/materialized/")
+        self.assertEqual(urls[f"cms.page:{self.parent.pk}"], "/en/parent/")
@@ -1,16 +1,26 @@
 import warnings
+from unittest.mock import patch
 
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils.html import escape
+from django.utils.translation import override
 
 from cms.api import add_plugin, create_page
 from cms.models import Placeholder, StaticPlaceholder
 from cms.test_utils.testcases import CMSTestCase
 
 from djangocms_link.cms_plugins import LinkPlugin
-from djangocms_link.models import AbstractLink
+from djangocms_link.helpers import LinkDict, get_cached_url
+from djangocms_link.models import AbstractLink, Link
 
 from .fixtures import TestFixture
 from .helpers import get_filer_file
+from .utils.models import ThirdPartyModel
 
 
 class LinkPluginsTestCase(TestFixture, CMSTestCase):
@@ -207,3 +217,143 @@ class LinkPluginsTestCase(TestFixture, CMSTestCase):
 
         response = self.client.get(self.page.get_absolute_url(self.language))
         self.assertContains(response, "<span>Link</span>")
+
+    def test_prefetch_links(self):
+        objs = [
+            ThirdPartyModel.objects.create(name=f"Object {i}", path=f"/object-{i}/")
+            for i in range(3)
+        ]
+        for obj in objs:
+            add_plugin(
+                self.placeholder,
+                "LinkPlugin",
+                "en",
+                name=obj.name,
+                link={"internal_link": f"utils.thirdpartymodel:{obj.pk}"},
+            )
+        self.publish(self.page, self.language)
+        request_url = self.page.get_absolute_url(self.language)
+        self.client.get(request_url)  # Warm up
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as unbatched:
+            response = self.client.get(request_url)
+        for obj in objs:
+            self.assertContains(response, f'<a href="{obj.path}">{obj.name}</a>')
+
+        cache.clear()
+        with patch.object(LinkPlugin, "prefetch_links", True), CaptureQueriesContext(connection) as batched:
+            response = self.client.get(request_url)
+        for obj in objs:
+            self.assertContains(response, f'<a href="{obj.path}">{obj.name}</a>')
+
+        # Three link lookups are replaced by a single one
+        self.assertEqual(len(batched), len(unbatched) - 2)
+
+    def test_menu_urls(self):
+        from djangocms_link import menu_urls
+
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        request.session = {}
+        links = [
+            LinkDict({"internal_link": f"cms.page:{self.page.pk}", "anchor": "#top"}),
+            LinkDict({"internal_link": f"cms.page:{self.home.pk}"}),
+            LinkDict({"internal_link": "cms.page:0"}),  # Not in menu
+        ]
+        expected = [self.page.get_absolute_url() + "#top", self.home.get_absolute_url()]
+        with override(self.language):
+            menu_urls.get_menu_urls(request)  # Warm up
+
+            with self.assertNumQueries(0):
+                menu_urls.resolve_from_menu(request, links, 1)
+                menu_urls.resolve_from_menu(request, links, 1)
+                self.assertEqual([link.url for link in links[:2]], expected)
+            self.assertEqual(get_cached_url(links[2], 1), (False, None))
+
+            other_site_link = LinkDict({"internal_link": f"cms.page:{self.page.pk}"})
+            menu_urls.resolve_from_menu(request, [other_site_link], 2)
+            self.assertEqual(get_cached_url(other_site_link, 2), (False, None))
+
+    def test_render_with_menu_urls(self):
+        from djangocms_link import menu_urls
+
+        for page in (self.home, self.static_page):
+            add_plugin(
+                self.placeholder,
+                "LinkPlugin",
+                "en",
+                name="Link",
+                link={"internal_link": f"cms.page:{page.pk}"},
+            )
+        self.publish(self.page, self.language)
+
+        with patch.object(menu_urls, "MENU_URLS", True):
+            response = self.client.get(self.page.get_absolute_url(self.language))
+        for page in (self.home, self.static_page):
+            self.assertContains(response, f'href="{page.get_absolute_url()}"')
+
+    def test_render_deferred_links(self):
+        from djangocms_link import deferred
+
+        objs = [ThirdPartyModel.objects.create(name=f"Object {i}", path=f"/object-{i}/?a=1&b=2") for i in range(3)]
+        for obj in objs:
+            add_plugin(
+                self.placeholder,
+                "LinkPlugin",
+                "en",
+                name=obj.name,
+                link={"internal_link": f"utils.thirdpartymodel:{obj.pk}"},
+            )
+        self.publish(self.page, self.language)
+        request_url = self.page.get_absolute_url(self.language)
+        self.client.get(request_url)  # Warm up
+
+        cache.clear()
+        with CaptureQueriesContext(connection) as immediate:
+            self.client.get(request_url)
+
+        cache.clear()
+        middleware = {"append": "djangocms_link.middleware.DeferredLinksMiddleware"}
+        with patch.object(deferred, "DEFERRED_LINKS", True), self.modify_settings(MIDDLEWARE=middleware):
+            client = self.client_class()  # Loads the middleware
+            with CaptureQueriesContext(connection) as deferred_queries:
+                response = client.get(request_url)
+        for obj in objs:
+            self.assertContains(response, f'<a href="{escape(obj.path)}">{obj.name}</a>')
+        self.assertNotContains(response, "djangocms-link:")
+        # Three link lookups are replaced by a single one
+        self.assertEqual(len(deferred_queries), len(immediate) - 2)
+
+    def test_prefetch_links_plugin_tree(self):
+        from djangocms_link.cms_plugins import prefetch_links
+
+        parent = add_plugin(
+            self.placeholder,
+            "LinkPlugin",
+            "en",
+            link={"internal_link": f"cms.page:{self.page.pk}"},
+        )
+        children = [
+            add_plugin(
+                self.placeholder,
+                "LinkPlugin",
+                "en",
+                target=parent,
+                link={"internal_link": f"cms.page:{page.pk}"},
+            )
+            for page in (self.home, self.static_page)
+        ]
+        # Plugin tree without placeholder as loaded from the database
+        parent = Link.objects.get(pk=parent.pk)
+        children = list(Link.objects.filter(pk__in=[child.pk for child in children]).order_by("pk"))
+        for child in children:
+            child._state.fields_cache["parent"] = parent
+        parent.child_plugin_instances = children
+
+        expected = [page.get_absolute_url() for page in (self.page, self.home, self.static_page)]
+
+        prefetch_links(children[0], 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual([plugin.link.url for plugin in [parent, *children]], expected)
@@ -0,0 +1,47 @@
+from django.test import TestCase
+
+from tests.utils.models import AnotherLinkableModel, LinkedModel, ThirdPartyModel
+
+
+class PrefetchLinksTestCase(TestCase):
+    def setUp(self):
+        self.objs = [ThirdPartyModel.objects.create(name=f"Obj {i}", path=f"/obj-{i}/") for i in range(3)]
+        self.other = AnotherLinkableModel.objects.create(title="Other", slug="other")
+        for obj in self.objs:
+            LinkedModel.objects.create(
+                link={"internal_link": f"utils.thirdpartymodel:{obj.pk}", "anchor": "#top"},
+                secondary_link={"internal_link": f"utils.anotherlinkablemodel:{self.other.pk}"},
+            )
+        LinkedModel.objects.create(link={"external_link": "https://example.com"})
+
+    def test_prefetch_links(self):
+        with self.assertNumQueries(3):  # Rows and one query per target model
+            rows = list(LinkedModel.objects.prefetch_links("link", "secondary_link").order_by("pk"))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [row.link.url for row in rows],
+                ["/obj-0/#top", "/obj-1/#top", "/obj-2/#top", "https://example.com"],
+            )
+            self.assertEqual([row.secondary_link.url for row in rows], ["/another/other/"] * 3 + [""])
+            self.assertEqual(rows[0].link.target, self.objs[0])
+            self.assertEqual(rows[0].secondary_link.target, self.other)
+
+    def test_prefetch_links_chained(self):
+        qs = LinkedModel.objects.prefetch_links("link").filter(link__has_key="internal_link")
+        with self.assertNumQueries(2):
+            rows = list(qs.order_by("pk"))
+            self.assertEqual(rows[1].link.url, "/obj-1/#top")
+
+        with self.assertNumQueries(1):
+            rows = list(qs.prefetch_links(None))
+        with self.assertNumQueries(1):
+            self.assertEqual(rows[0].link.url, "/obj-0/#top")
+
+    def test_prefetch_links_values(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(LinkedModel.objects.prefetch_links("link").values_list("pk").count(), 4)
+
+    def test_prefetch_links_invalid_field(self):
+        with self.assertRaises(ValueError):
+            LinkedModel.objects.prefetch_links("id")
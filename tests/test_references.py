@@ -0,0 +1,84 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from djangocms_link import references, stored_urls
+from djangocms_link.models import Link, LinkReference
+from tests.helpers import get_filer_file, get_target_models
+from tests.utils.models import ThirdPartyModel
+
+
+class LinkReferenceTestCase(TestCase):
+    def setUp(self):
+        patcher = patch.object(references, "INDEX_LINKS", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        references.connect_signals()
+        with patch.object(stored_urls, "STORE_URLS", True):
+            stored_urls.connect_signals(get_target_models())
+        self.obj = ThirdPartyModel.objects.create(name="Object", path="/object/")
+        self.other = ThirdPartyModel.objects.create(name="Other", path="/other/")
+
+    def create_link(self, obj):
+        return Link.objects.create(language="en", link={"internal_link": f"utils.thirdpartymodel:{obj.pk}"})
+
+    def test_index_kept_current(self):
+        link = self.create_link(self.obj)
+        Link.objects.create(language="en", link={"external_link": "https://www.example.com"})
+
+        self.assertEqual(LinkReference.objects.pointing_to(self.obj).sources(), [link])
+        self.assertEqual(LinkReference.objects.count(), 1)
+
+        link.link = {"internal_link": f"utils.thirdpartymodel:{self.other.pk}"}
+        link.save()
+        self.assertEqual(LinkReference.objects.pointing_to(self.obj).sources(), [])
+        self.assertEqual(
+            LinkReference.objects.pointing_to(f"utils.thirdpartymodel:{self.other.pk}").sources(), [link]
+        )
+
+        link.delete()
+        self.assertFalse(LinkReference.objects.exists())
+
+    def test_file_links(self):
+        file = get_filer_file()
+        link = Link.objects.create(language="en", link={"file_link": str(file.pk)})
+
+        self.assertEqual(LinkReference.objects.pointing_to(file).sources(), [link])
+        file.delete()
+
+    def test_rebuild_command(self):
+        with patch.object(references, "INDEX_LINKS", False):
+            links = [self.create_link(self.obj) for _ in range(3)]
+            self.create_link(self.other)
+        self.assertFalse(LinkReference.objects.exists())
+
+        output = StringIO()
+        call_command("rebuild_link_index", batch_size=2, stdout=output)
+
+        self.assertIn("Indexed 4 link references.", output.getvalue())
+        self.assertEqual(
+            sorted(link.pk for link in LinkReference.objects.pointing_to(self.obj).sources()),
+            [link.pk for link in links],
+        )
+
+    @patch.object(stored_urls, "STORE_URLS", True)
+    def test_stored_urls_refreshed_through_index(self):
+        link = self.create_link(self.obj)
+        self.obj.path = "/changed/"
+
+        with self.assertNumQueries(5):
+            # Save, find references in index, fetch rows and target, update rows
+            self.obj.save()
+
+        link.refresh_from_db()
+        self.assertEqual(link.link_urls, {"en": [None, "/changed/"]})
+
+
+class LinkReferenceSignalsTestCase(TestCase):
+    def test_not_connected_if_disabled(self):
+        with patch.object(references, "INDEX_LINKS", False), patch.object(references, "post_save") as post_save:
+            references.connect_signals()
+
+        post_save.connect.assert_not_called()
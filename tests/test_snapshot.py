@@ -0,0 +1,89 @@
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.translation import override
+
+from djangocms_link import snapshot
+from djangocms_link.helpers import get_link, get_site_domains, resolve_links
+from tests.helpers import get_target_models
+from tests.utils.models import ThirdPartyModel
+
+
+class SnapshotTestCase(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "links.snapshot")
+        for name, value in (("SNAPSHOT", self.path), ("CHECK_INTERVAL", 0), ("_snapshot", None), ("_checked", 0.0)):
+            patcher = patch.object(snapshot, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        snapshot.connect_signals(get_target_models())
+        self.addCleanup(lambda: snapshot._snapshot and snapshot._snapshot.close())
+        self.site = Site.objects.get_current()
+        self.obj = ThirdPartyModel.objects.create(name="Object", path="/object/")
+
+    def link(self, obj, **kwargs):
+        return {"internal_link": f"utils.thirdpartymodel:{obj.pk}", **kwargs}
+
+    def test_command_writes_snapshot(self):
+        out = StringIO()
+        call_command("write_link_snapshot", stdout=out)
+
+        self.assertIn(f"to {self.path}", out.getvalue())
+        self.assertEqual(snapshot.get_snapshot().get(f"utils.thirdpartymodel:{self.obj.pk}", "fr"), (None, "/object/"))
+
+    def test_urls_read_from_snapshot(self):
+        other_site = Site.objects.create(domain="other.example.com", name="Other site")
+        remote = ThirdPartyModel.objects.create(name="Remote", path="/remote/", site=other_site)
+        snapshot.build()
+        get_site_domains()
+
+        with override("en"), self.assertNumQueries(0):
+            self.assertEqual(get_link(self.link(self.obj, anchor="#top"), self.site.pk), "/object/#top")
+            self.assertEqual(get_link(self.link(remote), self.site.pk), "//other.example.com/remote/")
+            links = [self.link(self.obj), self.link(remote)]
+            resolve_links(links, other_site.pk)
+            self.assertEqual([get_link(link, other_site.pk) for link in links], ["/object/", "/remote/"])
+
+    def test_missing_targets_resolved_from_database(self):
+        snapshot.build()
+        obj = ThirdPartyModel(name="Unsaved", path="/new/")
+        ThirdPartyModel.objects.bulk_create([obj])  # Does not send signals
+
+        with override("en"):
+            self.assertEqual(get_link(self.link(ThirdPartyModel.objects.get(name="Unsaved"))), "/new/")
+
+    def test_stale_after_change(self):
+        snapshot.build()
+        self.obj.path = "/changed/"
+        self.obj.save()
+
+        with override("en"):
+            self.assertEqual(get_link(self.link(self.obj)), "/changed/")
+        self.assertIsNone(snapshot.get_snapshot())
+
+        snapshot.build()
+        current = snapshot.get_snapshot()
+        self.assertEqual(current.get(f"utils.thirdpartymodel:{self.obj.pk}", "en"), (None, "/changed/"))
+
+    def test_hash_collisions(self):
+        other = ThirdPartyModel.objects.create(name="Other", path="/other/")
+        with patch.object(snapshot, "get_hash", lambda key: 0):
+            snapshot.build()
+            current = snapshot.get_snapshot()
+
+            self.assertEqual(current.get(f"utils.thirdpartymodel:{self.obj.pk}", "en"), (None, "/object/"))
+            self.assertEqual(current.get(f"utils.thirdpartymodel:{other.pk}", "fr"), (None, "/other/"))
+            self.assertIsNone(current.get("utils.thirdpartymodel:0", "en"))
+
+    def test_not_used_if_disabled(self):
+        snapshot.build()
+
+        with patch.object(snapshot, "SNAPSHOT", None):
+            self.assertIsNone(snapshot.get_snapshot())
@@ -0,0 +1,138 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.translation import override
+
+from cms.api import create_page
+from cms.models import Page
+
+from djangocms_link import stored_urls
+from djangocms_link.helpers import LinkDict, get_link, get_site_domains
+from djangocms_link.models import Link
+from tests.helpers import get_target_models
+from tests.utils.models import ThirdPartyModel
+
+
+class StoredUrlsTestCase(TestCase):
+    def setUp(self):
+        patcher = patch.object(stored_urls, "STORE_URLS", True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        stored_urls.connect_signals(get_target_models())
+        self.site = Site.objects.get_current()
+        self.obj = ThirdPartyModel.objects.create(name="Object", path="/object/")
+
+    def create_link(self, obj, **kwargs):
+        link = Link.objects.create(
+            language="en",
+            link={"internal_link": f"utils.thirdpartymodel:{obj.pk}", **kwargs},
+        )
+        return Link.objects.get(pk=link.pk)
+
+    def test_url_stored_on_save(self):
+        link = self.create_link(self.obj, anchor="#top")
+
+        self.assertEqual(link.link_urls, {"en": [None, "/object/#top"]})
+        with self.assertNumQueries(0), override("en"):
+            self.assertEqual(link.get_link(self.site.pk), "/object/#top")
+
+    def test_cross_site_domain_added_on_read(self):
+        other_site = Site.objects.create(domain="other.example.com", name="Other site")
+        obj = ThirdPartyModel.objects.create(name="Remote", path="/remote/", site=other_site)
+        link = self.create_link(obj)
+        get_site_domains()  # Warm the site map
+
+        with self.assertNumQueries(0), override("en"):
+            self.assertEqual(get_link(link.link, self.site.pk), "//other.example.com/remote/")
+        with override("en"):
+            self.assertEqual(get_link(self.create_link(obj).link, other_site.pk), "/remote/")
+
+    def test_refreshed_when_target_changes(self):
+        links = [self.create_link(self.obj) for _ in range(3)]
+        other = self.create_link(ThirdPartyModel.objects.create(name="Other", path="/other/"))
+
+        self.obj.path = "/changed/"
+        self.obj.save()
+
+        for link in links:
+            link.refresh_from_db()
+            self.assertEqual(link.link_urls, {"en": [None, "/changed/"]})
+        other.refresh_from_db()
+        self.assertEqual(other.link_urls, {"en": [None, "/other/"]})
+
+        self.obj.delete()
+        links[0].refresh_from_db()
+        self.assertEqual(links[0].link_urls, {"en": [None, None]})
+
+    def test_other_language_resolved_from_target(self):
+        link = self.create_link(self.obj)
+
+        with self.assertNumQueries(1), override("fr"):
+            self.assertEqual(link.get_link(self.site.pk), "/object/")
+
+    def test_not_stored_if_disabled(self):
+        with patch.object(stored_urls, "STORE_URLS", False):
+            link = self.create_link(self.obj)
+
+        self.assertEqual(link.link_urls, {})
+
+    def test_stored_urls_ignored_if_disabled(self):
+        link = self.create_link(self.obj)
+        ThirdPartyModel.objects.filter(pk=self.obj.pk).update(path="/changed/")  # No signals
+
+        with patch.object(stored_urls, "STORE_URLS", False), override("en"):
+            self.assertEqual(Link.objects.get(pk=link.pk).get_link(self.site.pk), "/changed/")
+
+    def test_not_added_to_abstract_link(self):
+        from djangocms_link.models import AbstractLink
+
+        self.assertNotIn("link_urls", [field.name for field in AbstractLink._meta.get_fields()])
+
+    def test_descendants_refreshed_on_path_change(self):
+        parent = create_page("parent", "page.html", "en")
+        child = create_page("child", "page.html", "en", parent=parent)
+        link = Link.objects.create(language="en", link={"internal_link": f"cms.page:{child.pk}"})
+        Link.objects.filter(pk=link.pk).update(link_urls={"en": [None, "/stale/"]})
+
+        Page.objects.get(pk=parent.pk).save()
+        page_url = parent.urls.get(language="en")
+        page_url.save()
+        self.assertEqual(Link.objects.get(pk=link.pk).link_urls, {"en": [None, "/stale/"]})
+
+        page_url.slug = page_url.path = "new-parent"
+        page_url.save()
+        self.assertEqual(Link.objects.get(pk=link.pk).link_urls["en"][1], "/en/parent/child/")
+
+    def test_assigned_link_not_resolved_from_stored_urls(self):
+        link = self.create_link(self.obj)
+        other = ThirdPartyModel.objects.create(name="Other", path="/other/")
+
+        link.link = LinkDict({"internal_link": f"utils.thirdpartymodel:{other.pk}"})
+
+        with override("en"):
+            self.assertEqual(link.get_link(self.site.pk), "/other/")
+        link.save()
+        self.assertEqual(Link.objects.get(pk=link.pk).link_urls, {"en": [None, "/other/"]})
+
+    def test_refresh_command(self):
+        with patch.object(stored_urls, "STORE_URLS", False):
+            link = self.create_link(self.obj)
+        out = StringIO()
+
+        call_command("refresh_stored_urls", batch_size=1, stdout=out)
+
+        self.assertIn("Refreshed the stored urls of 1 rows.", out.getvalue())
+        self.assertEqual(Link.objects.get(pk=link.pk).link_urls, {"en": [None, "/object/"]})
+
+
+class StoredUrlsSignalsTestCase(TestCase):
+    def test_not_connected_if_disabled(self):
+        with patch.object(stored_urls, "STORE_URLS", False), patch.object(
+            stored_urls, "connect_model_signals"
+        ) as connect_model_signals:
+            stored_urls.connect_signals(get_target_models())
+
+        connect_model_signals.assert_not_called()
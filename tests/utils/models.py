@@ -1,5 +1,8 @@
 from django.db import models
 
+from djangocms_link.fields import LinkField
+from djangocms_link.models import LinkQuerySet
+
 
 class ThirdPartyModel(models.Model):
     name = models.CharField(max_length=255)
@@ -23,3 +26,10 @@ class AnotherLinkableModel(models.Model):
 
     def __str__(self):
         return self.title
+
+
+class LinkedModel(models.Model):
+    link = LinkField(blank=True)
+    secondary_link = LinkField(blank=True)
+
+    objects = LinkQuerySet.as_manager()